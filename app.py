@@ -4,6 +4,7 @@ from dashboard import config
 
 
 if __name__ == "__main__":  # pragma: no cover
-    # For production: use gunicorn with multiple workers, e.g.:
-    # gunicorn app:server --workers 4 --threads 2 --timeout 120 --bind 0.0.0.0:8050
+    # For production: use gunicorn with threaded workers (settings live in gunicorn.conf.py):
+    # gunicorn app:server -c gunicorn.conf.py
+    # equivalent to: gunicorn app:server --worker-class gthread --workers <CPUs, min 2> --threads 8 --preload
     app.run(host="0.0.0.0", port=config.PORT, debug=config.DEBUG)
@@ -0,0 +1,30 @@
+// Clientside callbacks (served automatically by Dash from /assets)
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        // Revenue/Cost by dimension from the per-group sums in `dim-store`; Sum/Average
+        // is applied here so toggling it never round-trips to the server. Sums skip NaNs,
+        // so the mean divides by each column's non-NaN count (none left: no bar)
+        dimensionFigure: function (dim, agg) {
+            var layout = {paper_bgcolor: "white", plot_bgcolor: "white"};
+            if (!dim) {
+                return {data: [], layout: layout};
+            }
+            var revenue = dim.revenue, cost = dim.cost;
+            if (agg === "mean") {
+                var mean = function (sums, counts) {
+                    return sums.map(function (v, i) { return counts[i] ? v / counts[i] : null; });
+                };
+                revenue = mean(revenue, dim.revenue_n);
+                cost = mean(cost, dim.cost_n);
+            }
+            var by = dim.groupby.charAt(0).toUpperCase() + dim.groupby.slice(1);
+            return {
+                data: [
+                    {type: "bar", x: dim.x, y: revenue, name: "Revenue"},
+                    {type: "bar", x: dim.x, y: cost, name: "Cost"}
+                ],
+                layout: Object.assign({barmode: "group", title: "Revenue/Cost by " + by}, layout)
+            };
+        }
+    }
+});
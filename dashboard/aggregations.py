@@ -0,0 +1,185 @@
+"""Group-by kernels over dense integer codes.
+
+Dimension columns are categoricals (or factorized on the fly), so grouping reduces to a
+scatter-add into a small `ngroups` buffer: `np.bincount` does exactly that in C, with no
+hash-table machinery and no intermediate DataFrames.
+
+The kernels run on the filtered rows rather than on a cube pre-aggregated at cache
+time: the owner search and min-profit filter are row-level predicates that a cube
+keyed by dimensions cannot answer, and the detail table needs the filtered rows anyway,
+so a cube would add a second filter pass without removing the first.
+"""
+from typing import Any, Dict, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def group_codes(col: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Return non-negative integer codes for `col` and the labels they index.
+
+    Categorical columns reuse their codes; other columns are factorized in sorted order.
+    Rows with missing keys are assigned code ``len(labels)`` (one past the last label)
+    so they can be dropped by slicing the kernel outputs to ``len(labels)``.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        codes = col.cat.codes.to_numpy()
+        labels = col.cat.categories
+    else:
+        codes, labels = pd.factorize(col, sort=True)
+    codes = codes.astype(np.intp, copy=False)
+    if codes.size and codes.min() < 0:
+        codes = np.where(codes < 0, len(labels), codes)
+    return codes, labels
+
+
+def sorted_group_codes(col: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """`group_codes` for a column that is already sorted ascending (missing values last).
+
+    Groups are runs of equal values, so codes are a cumulative count of value changes:
+    one comparison pass with no hashing or re-sorting.
+    """
+    values = col.to_numpy()
+    n_valid = len(values) - int(np.count_nonzero(pd.isna(values)))
+    valid = values[:n_valid]
+    change = np.empty(n_valid, dtype=bool)
+    if n_valid:
+        change[0] = True
+        np.not_equal(valid[1:], valid[:-1], out=change[1:])
+    labels = pd.Index(valid[change])
+    codes = np.empty(len(values), dtype=np.intp)
+    np.cumsum(change, out=codes[:n_valid])
+    codes[:n_valid] -= 1
+    codes[n_valid:] = len(labels)
+    return codes, labels
+
+
+def group_sum(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group sum of `values` (float64) for codes in ``[0, ngroups)``; NaNs are skipped."""
+    values = np.asarray(values, dtype=np.float64)
+    nans = np.isnan(values)
+    if nans.any():
+        values = np.where(nans, 0.0, values)
+    return np.bincount(codes, weights=values, minlength=ngroups)[:ngroups]
+
+
+def group_count(codes: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group row count for codes in ``[0, ngroups)``."""
+    return np.bincount(codes, minlength=ngroups)[:ngroups]
+
+
+def group_valid_count(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group count of non-NaN `values` for codes in ``[0, ngroups)`` (the divisor of a mean)."""
+    nans = np.isnan(np.asarray(values, dtype=np.float64))
+    if not nans.any():
+        return group_count(codes, ngroups)
+    return group_count(codes[~nans], ngroups)
+
+
+def day_slice(dates: np.ndarray, start: Any = None, end: Any = None) -> slice:
+    """Row slice covering days ``[start, end]`` of an ascending datetime64 array.
+
+    Both bounds are found by binary search, so a date window costs O(log n) rather than
+    two full-column comparisons. Either bound may be None (open-ended).
+    """
+    lo = 0 if start is None else int(np.searchsorted(dates, np.asarray(start, dtype=dates.dtype), side="left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.asarray(end, dtype=dates.dtype), side="right"))
+    return slice(lo, max(lo, hi))
+
+
+class Summary(NamedTuple):
+    """Everything `update_viz` renders, derived from one set of codes per dimension."""
+
+    total_revenue: float
+    total_cost: float
+    total_profit: float
+    red_systems: int
+    dim_labels: pd.Index
+    dim_rows: np.ndarray
+    dim_revenue: np.ndarray
+    dim_revenue_n: np.ndarray
+    dim_cost: np.ndarray
+    dim_cost_n: np.ndarray
+    dim_profit: np.ndarray
+    date_labels: pd.Index
+    date_profit: np.ndarray
+    system_labels: pd.Index
+    status_labels: pd.Index
+    system_status_rows: np.ndarray
+    team_labels: pd.Index
+    team_rows: np.ndarray
+
+
+def summarize(df: pd.DataFrame, groupby: str, today: Any, red_label: str = "Red") -> Summary:
+    """Compute KPIs and every figure grouping for the filtered frame in one fused pass.
+
+    `df` must be sorted by `date` (the repository guarantees this).
+
+    Each value column is pulled out once and each dimension is coded once. KPI totals are
+    folded from the per-group partial sums (including the missing-key slot) instead of
+    rescanning the columns, and the red-systems KPI reuses the date/status/system codes.
+    """
+    revenue = df["revenue"].to_numpy()
+    cost = df["cost"].to_numpy()
+    profit = df["profit"].to_numpy()
+
+    # Each column is coded at most once; the groupby dimension is usually one of the
+    # columns the fixed figures group by anyway (date, system, status, team)
+    coded: Dict[str, Tuple[np.ndarray, pd.Index]] = {}
+
+    def codes_for(col: str) -> Tuple[np.ndarray, pd.Index]:
+        if col not in coded:
+            # `date` is sorted, so its groups are runs and need no hashing
+            coded[col] = sorted_group_codes(df[col]) if col == "date" else group_codes(df[col])
+        return coded[col]
+
+    dim_codes, dim_labels = codes_for(groupby)
+    n_dim = len(dim_labels) + 1  # trailing slot collects rows with a missing key
+    dim_revenue = group_sum(dim_codes, revenue, n_dim)
+    dim_cost = group_sum(dim_codes, cost, n_dim)
+    dim_profit = group_sum(dim_codes, profit, n_dim)
+
+    date_codes, date_labels = codes_for("date")
+    date_profit = group_sum(date_codes, profit, len(date_labels))
+
+    system_codes, system_labels = codes_for("system")
+    status_codes, status_labels = codes_for("status")
+    n_status = len(status_labels) + 1
+    system_status_rows = group_count(
+        system_codes * n_status + status_codes, len(system_labels) * n_status
+    ).reshape(len(system_labels), n_status)[:, :-1]
+
+    team_codes, team_labels = codes_for("team")
+
+    # Rows are sorted by date, so "today" is a contiguous slab found by binary search; the
+    # red test then runs on int codes within that slab only, and distinct systems are
+    # counted by scattering into a per-system "seen" table (the last slot absorbs missing)
+    red_systems = 0
+    if red_label in status_labels:
+        slab = day_slice(df["date"].to_numpy(), today, today)
+        if slab.stop > slab.start:
+            hit = status_codes[slab] == status_labels.get_loc(red_label)
+            seen = np.zeros(len(system_labels) + 1, dtype=bool)
+            seen[system_codes[slab][hit]] = True
+            red_systems = int(np.count_nonzero(seen[:-1]))
+
+    return Summary(
+        total_revenue=float(dim_revenue.sum()),
+        total_cost=float(dim_cost.sum()),
+        total_profit=float(dim_profit.sum()),
+        red_systems=red_systems,
+        dim_labels=dim_labels,
+        dim_rows=group_count(dim_codes, len(dim_labels)),
+        dim_revenue=dim_revenue[:-1],
+        dim_revenue_n=group_valid_count(dim_codes, revenue, len(dim_labels)),
+        dim_cost=dim_cost[:-1],
+        dim_cost_n=group_valid_count(dim_codes, cost, len(dim_labels)),
+        dim_profit=dim_profit[:-1],
+        date_labels=date_labels,
+        date_profit=date_profit,
+        system_labels=system_labels,
+        status_labels=status_labels,
+        system_status_rows=system_status_rows,
+        team_labels=team_labels,
+        team_rows=group_count(team_codes, len(team_labels)),
+    )
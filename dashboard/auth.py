@@ -1,13 +1,34 @@
+import functools
+import hashlib
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 
 import jwt
-from flask import request, abort, g, Flask
+from flask import request, abort, g, has_app_context, Flask
 from pydantic import BaseModel, Field, field_validator, ValidationError
 
 from .config import Settings, get_settings
 
 
+# Token role aliases -> app roles; built once, read-only, with interned strings
+_ROLE_MAP = MappingProxyType({
+    sys.intern(alias): sys.intern(role)
+    for alias, role in {
+        "CIO": "CIO",
+        "ChiefInformationOfficer": "CIO",
+        "Architect": "Architect",
+        "EnterpriseArchitect": "Architect",
+        "SystemArchitect": "Architect",
+        "SolutionArchitect": "Architect",
+        "Developer": "Developer",
+        "Engineer": "Developer",
+    }.items()
+})
+
+
 class JWTClaims(BaseModel):
     """Pydantic model for normalized JWT claims used by the app."""
 
@@ -20,18 +41,27 @@ class JWTClaims(BaseModel):
     @field_validator("role", mode="before")
     @classmethod
     def normalize_role(cls, v):
-        role = (v or "Developer") if isinstance(v, str) else "Developer"
-        role_map = {
-            "CIO": "CIO",
-            "ChiefInformationOfficer": "CIO",
-            "Architect": "Architect",
-            "EnterpriseArchitect": "Architect",
-            "SystemArchitect": "Architect",
-            "SolutionArchitect": "Architect",
-            "Developer": "Developer",
-            "Engineer": "Developer",
-        }
-        return role_map.get(role, "Developer")
+        if not isinstance(v, str):
+            return "Developer"
+        return _ROLE_MAP.get(v, "Developer")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_claims(hour: int) -> dict:
+    """Validated dev default claims for one clock hour (`exp` falls 1-2 hours ahead)."""
+    return JWTClaims(
+        sub="devuser@example.com",
+        name="Dev User",
+        role="Developer",
+        team="Platform",
+        exp=(hour + 2) * 3600,
+    ).model_dump()
+
+
+# Shared decoder: default options are merged once here instead of on every request
+_JWT_DECODER = jwt.PyJWT(options={"require": ["exp"], "verify_exp": True})
+_JWT_ALGORITHMS = ["HS256"]
+_TOKEN_CACHE_SIZE = 4096
 
 
 class AuthService:
@@ -39,31 +69,53 @@ class AuthService:
 
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self.settings = settings or get_settings()
+        # Validated claims per (token digest, secret, issuer, audience); entries live until token exp
+        self._token_cache: Dict[Tuple[bytes, str, Optional[str], Optional[str]], dict] = {}
+        self._token_cache_lock = threading.Lock()
 
     def _decode_jwt(self, token: str) -> dict:
         """Decode and validate a JWT (HS256 by default)."""
-        options = {"require": ["exp"], "verify_exp": True}
-        kwargs: Dict[str, Any] = {"algorithms": ["HS256"]}
+        kwargs: Dict[str, Any] = {}
         if self.settings.jwt_issuer:
             kwargs["issuer"] = self.settings.jwt_issuer
         if self.settings.jwt_audience:
             kwargs["audience"] = self.settings.jwt_audience
-        return jwt.decode(token, self.settings.jwt_secret, options=options, **kwargs)
+        return _JWT_DECODER.decode(token, self.settings.jwt_secret, algorithms=_JWT_ALGORITHMS, **kwargs)
+
+    def validate_token(self, token: str) -> dict:
+        """Return normalized claims for `token`, skipping HMAC + validation on repeat tokens.
+
+        Dash fires a request per interaction with the same bearer token, so results are
+        memoized under a 128-bit BLAKE2b digest and reused until the token's `exp`.
+        """
+        s = self.settings
+        key = (hashlib.blake2b(token.encode(), digest_size=16).digest(), s.jwt_secret, s.jwt_issuer, s.jwt_audience)
+        claims = self._token_cache.get(key)
+        if claims is not None and time.time() < claims["exp"]:
+            return dict(claims)
+
+        claims = JWTClaims.model_validate(self._decode_jwt(token)).model_dump()
+        with self._token_cache_lock:
+            if len(self._token_cache) >= _TOKEN_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[key] = claims
+        return dict(claims)
 
     def default_claims(self) -> dict:
-        # Safe local dev defaults
-        model = JWTClaims(
-            sub="devuser@example.com",
-            name="Dev User",
-            role="Developer",
-            team="Platform",
-            exp=int(time.time()) + 3600,
-        )
-        return model.model_dump()
+        """Safe local dev defaults; built and validated once per hour rather than per request."""
+        return dict(_default_claims(int(time.time()) // 3600))
 
     def current_claims(self) -> dict:
-        """Access JWT claims for this request (fallback to defaults in dev)."""
-        return getattr(g, "claims", self.default_claims())
+        """Access JWT claims for this request (fallback to defaults in dev).
+
+        With auth disabled every request gets the default claims, so they are returned
+        directly without touching the request context.
+        """
+        if self.settings.disable_auth:
+            return self.default_claims()
+        claims = g.get("claims") if has_app_context() else None
+        return claims if claims is not None else self.default_claims()
 
     def init_app(self, server: Flask) -> None:
         """Register a before_request auth guard on the Flask server."""
@@ -84,9 +136,7 @@ class AuthService:
 
             token = auth.split(" ", 1)[1].strip()
             try:
-                decoded = self._decode_jwt(token)
-                claims_obj = JWTClaims.model_validate(decoded)
-                claims = claims_obj.model_dump()
+                claims = self.validate_token(token)
             except (Exception, ValidationError) as e:  # noqa: BLE001
                 abort(401, description=f"Invalid token: {e}")
 
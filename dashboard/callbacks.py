@@ -1,44 +1,98 @@
 import datetime as dt
+import functools
 import time
-from typing import List, Optional, Literal
+from typing import Callable, List, Optional
 
+import numpy as np
 import pandas as pd
-from dash import Input, Output, State, no_update
-from pydantic import BaseModel, field_validator, ValidationError
+from dash import ClientsideFunction, Input, Output, State, ctx, no_update
 
+from .aggregations import day_slice, summarize
 from .config import get_settings
-from .data import get_data
+from .data import get_data, get_data_for_team
+from .datasources.base import DIMENSION_COLUMNS
+from .datasources.ipc import frame_from_b64, frame_to_b64, frame_to_csv
 from .utils import today_key, fmt_money
 
 
-class Filters(BaseModel):
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    products: Optional[List[str]] = None
-    regions: Optional[List[str]] = None
-    systems: Optional[List[str]] = None
-    teams: Optional[List[str]] = None
-    min_profit: Optional[float] = None
-    owner_query: Optional[str] = None
-    agg: Literal["sum", "mean"] = "sum"
-    groupby: str = "date"
-
-    @field_validator("products", "regions", "systems", "teams", mode="before")
-    @classmethod
-    def ensure_list(cls, v):
-        if v is None or v == "":
-            return None
-        if isinstance(v, list):
-            return v
-        return [v]
-
-    @field_validator("owner_query", mode="before")
-    @classmethod
-    def normalize_query(cls, v):
-        if v is None:
-            return None
-        s = str(v).strip()
-        return s if s else None
+def _norm_list(v) -> Optional[List[str]]:
+    """Dropdown value -> list of selections, or None when nothing is selected."""
+    if v is None or v == "":
+        return None
+    if isinstance(v, list):
+        return v
+    return [v]
+
+
+def _norm_query(v) -> Optional[str]:
+    """Free-text value -> stripped string, or None when blank."""
+    if v is None:
+        return None
+    s = str(v).strip()
+    return s if s else None
+
+
+def _norm_number(v) -> Optional[float]:
+    """Slider value -> float or None; raises ValueError for non-numeric input."""
+    if v is None:
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid number: {v!r}") from e
+
+
+_GROUPBY_COLUMNS = frozenset({"date", *DIMENSION_COLUMNS})
+
+
+def _empty_visuals() -> tuple:
+    """`update_viz` outputs for a view with nothing to show (no data or invalid inputs)."""
+    empty_fig = {"data": [], "layout": {"paper_bgcolor": "white", "plot_bgcolor": "white"}}
+    return "—", "—", "—", "—", None, empty_fig, empty_fig, empty_fig, []
+
+
+# Up to this many selected codes are tested with chained equality compares
+_ISIN_OR_CHAIN_MAX = 4
+
+
+def _isin_mask(col: pd.Series, values: List[str]) -> np.ndarray:
+    """Membership mask; categorical columns are matched on their integer codes.
+
+    A few selections become an OR of ``codes == c`` compares (no hashing or sorting),
+    each written into one reused scratch buffer; larger ones index a per-category
+    lookup table with the codes.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        codes = col.cat.codes.to_numpy()
+        allowed = col.cat.categories.get_indexer(values)
+        allowed = allowed[allowed >= 0]
+        if len(allowed) <= _ISIN_OR_CHAIN_MAX:
+            mask = np.zeros(len(codes), dtype=bool)
+            if len(allowed):
+                scratch = np.empty(len(codes), dtype=bool)
+                for code in allowed:
+                    np.equal(codes, code, out=scratch)
+                    mask |= scratch
+            return mask
+        lut = np.zeros(len(col.cat.categories) + 1, dtype=bool)
+        lut[allowed] = True
+        return lut[codes]
+    return col.isin(values).to_numpy()
+
+
+def _contains_mask(col: pd.Series, q: str) -> np.ndarray:
+    """Case-insensitive substring mask (`q` must already be lowercased).
+
+    For categoricals the string work runs once per category rather than once per row,
+    and the hits are mapped back to rows by indexing a per-category lookup table with
+    the codes (the trailing False slot catches code -1, i.e. missing owners).
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        cats = col.cat.categories.astype(str).str.lower()
+        lut = np.zeros(len(cats) + 1, dtype=bool)
+        lut[:-1] = cats.str.contains(q, regex=False)
+        return lut[col.cat.codes.to_numpy()]
+    return col.astype(str).str.lower().str.contains(q, na=False, regex=False).to_numpy()
 
 
 def _filter_df(df: pd.DataFrame,
@@ -53,46 +107,91 @@ def _filter_df(df: pd.DataFrame,
     if df.empty:
         return df
 
-        # Build a combined boolean mask for efficiency
-    mask = pd.Series([True] * len(df), index=df.index)
-
-    if start_date:
-        try:
-            start_dt = pd.to_datetime(start_date).date()
-            mask &= df["date"] >= start_dt
-        except Exception as e:
-            raise ValueError(f"Invalid start_date format: {start_date}") from e
-
-    if end_date:
-        try:
-            end_dt = pd.to_datetime(end_date).date()
-            mask &= df["date"] <= end_dt
-        except Exception as e:
-            raise ValueError(f"Invalid end_date format: {end_date}") from e
+    # Dates: the frame is sorted by its datetime64 `date` column, so the range is a
+    # binary-searched slice rather than two full-column comparisons
+    if start_date or end_date:
+        start_dt = end_dt = None
+        if start_date:
+            try:
+                start_dt = pd.Timestamp(start_date).normalize().to_datetime64()
+            except Exception as e:
+                raise ValueError(f"Invalid start_date format: {start_date}") from e
+        if end_date:
+            try:
+                end_dt = pd.Timestamp(end_date).normalize().to_datetime64()
+            except Exception as e:
+                raise ValueError(f"Invalid end_date format: {end_date}") from e
+        df = df.iloc[day_slice(df["date"].to_numpy(), start_dt, end_dt)]
+
+    # Remaining predicates are ANDed into one ndarray in place; the slice is gathered once
+    # at the end. They are evaluated lazily so a predicate that empties the mask (e.g. a
+    # selection with no matching rows) skips the rest.
+    predicates: List[Callable[[], np.ndarray]] = []
 
     if products:  # Only filter if list is non-empty
-        mask &= df["product"].isin(products)
+        predicates.append(lambda: _isin_mask(df["product"], products))
 
     if regions:
-        mask &= df["region"].isin(regions)
+        predicates.append(lambda: _isin_mask(df["region"], regions))
 
     if systems:
-        mask &= df["system"].isin(systems)
+        predicates.append(lambda: _isin_mask(df["system"], systems))
 
     if teams:
-        mask &= df["team"].isin(teams)
+        predicates.append(lambda: _isin_mask(df["team"], teams))
 
     if owner_query:
         q = owner_query.strip().lower()
         if q:  # Only apply if non-empty after stripping
-            # Ensure owner column is string type
-            mask &= df["owner"].astype(str).str.lower().str.contains(q, na=False, regex=False)
+            predicates.append(lambda: _contains_mask(df["owner"], q))
 
     if min_profit is not None:
-        mask &= df["profit"] >= float(min_profit)
+        predicates.append(lambda: df["profit"].to_numpy() >= float(min_profit))
+
+    mask = np.ones(len(df), dtype=bool)
+    for predicate in predicates:
+        mask &= predicate()
+        if not mask.any():
+            return df.iloc[:0]
 
     return df[mask]
 
+
+def _table_records(df: pd.DataFrame) -> List[dict]:
+    """Rows as DataTable records, built column-wise.
+
+    Each column is converted to a Python list once (`date` as ISO day strings via numpy)
+    and rows are zipped together, instead of `to_dict(orient="records")` boxing every
+    cell through pandas' per-row path.
+    """
+    columns = list(df.columns)
+    values = [
+        df[c].to_numpy().astype("datetime64[D]").astype(str).tolist() if c == "date" else df[c].tolist()
+        for c in columns
+    ]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+@functools.lru_cache(maxsize=4)
+def _store_frame(data_json: str) -> pd.DataFrame:
+    """Decode a `data-store` payload, memoized per payload.
+
+    The store only changes on load/refresh while every filter touch re-sends it, so
+    repeat callbacks reuse the decoded frame. It is read-only and shared across requests.
+    """
+    return frame_from_b64(data_json)
+
+
+# Controls that only change the Revenue/Cost-by-dimension figure (agg is applied client-side)
+_DIMENSION_FIGURE_INPUTS = frozenset({"groupby-dd"})
+
+
+def _only_dimension_controls_triggered() -> bool:
+    """True when every input that fired this callback only affects the dimension figure."""
+    triggered = set(ctx.triggered_prop_ids.values())
+    return bool(triggered) and triggered <= _DIMENSION_FIGURE_INPUTS
+
+
 def register_callbacks(app):
 
     @app.callback(
@@ -112,15 +211,15 @@ def register_callbacks(app):
         if n_clicks and n_clicks > 0:
             force_key = f"{today_key()}__{int(time.time())}"
 
-        df = get_data(force_key=force_key)
-
         # RBAC: If Developer and token has 'team', scope data to their team
         role = (claims or {}).get("role", "Developer")
         team = (claims or {}).get("team")
         if role == "Developer" and team:
-            df = df[df["team"] == team].copy()
+            df = get_data_for_team(team, force_key=force_key)
+        else:
+            df = get_data(force_key=force_key)
 
-        data_json = df.to_dict(orient="records")
+        data_json = frame_to_b64(df)
         msg = f"Rows available: {len(df)} | Source: {get_settings().data_source} | Role: {role}" + (f" | Team: {team}" if team else "")
         return data_json, msg
 
@@ -129,7 +228,7 @@ def register_callbacks(app):
         Output("kpi-cost", "children"),
         Output("kpi-profit", "children"),
         Output("kpi-red", "children"),
-        Output("rev-by-dim-graph", "figure"),
+        Output("dim-store", "data"),
         Output("trend-graph", "figure"),
         Output("system-health-graph", "figure"),
         Output("team-workload-graph", "figure"),
@@ -143,111 +242,118 @@ def register_callbacks(app):
         Input("team-dd", "value"),
         Input("min-profit-slider", "value"),
         Input("search-owner", "value"),
-        Input("agg-radio", "value"),
         Input("groupby-dd", "value"),
         State("claims-store", "data"),
         prevent_initial_call=True
     )
     def update_viz(data_json, start_date, end_date, products, regions, systems, teams,
-                   min_profit, owner_query, agg, groupby, claims):
+                   min_profit, owner_query, groupby, claims):
         if not data_json:
-            empty_fig = {"data": [], "layout": {"paper_bgcolor": "white", "plot_bgcolor": "white"}}
-            return "—", "—", "—", "—", empty_fig, empty_fig, empty_fig, empty_fig, []
+            return _empty_visuals()
 
-        # Validate/normalize filters via Pydantic
+        # Normalize filters with plain helpers; this runs on every control change.
+        # Bad inputs (non-numeric profit, unknown groupby) render empty visuals
         try:
-            flt = Filters(
-                start_date=start_date,
-                end_date=end_date,
-                products=products,
-                regions=regions,
-                systems=systems,
-                teams=teams,
-                min_profit=min_profit,
-                owner_query=owner_query,
-                agg=agg,
-                groupby=groupby,
-            )
-        except ValidationError as e:
-            # In case of bad inputs, return empty visuals with a hint in debug
-            empty_fig = {"data": [], "layout": {"paper_bgcolor": "white", "plot_bgcolor": "white"}}
-            return "—", "—", "—", "—", empty_fig, empty_fig, empty_fig, empty_fig, []
-
-        df = pd.DataFrame.from_records(data_json)
-        # After JSON deserialization, date column is strings; convert back to date objects
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-        fdf = _filter_df(df, flt.start_date, flt.end_date, flt.products, flt.regions, flt.systems, flt.teams, flt.min_profit, flt.owner_query)
-
-        # KPIs
-        rev = float(fdf["revenue"].sum()) if not fdf.empty else 0.0
-        cost = float(fdf["cost"].sum()) if not fdf.empty else 0.0
-        profit = float(fdf["profit"].sum()) if not fdf.empty else 0.0
-        today = pd.to_datetime(end_date).date() if end_date else dt.date.today()
-        red_count = int(fdf[(fdf["date"] == today) & (fdf["status"] == "Red")]["system"].nunique())
-
-        kpi_rev = f"${fmt_money(rev)}"
-        kpi_cost = f"${fmt_money(cost)}"
-        kpi_profit = f"${fmt_money(profit)}"
-        kpi_red = str(red_count)
-
-        # Aggregation
-        agg_fn = {"sum": "sum", "mean": "mean"}.get(agg, "sum")
-        if fdf.empty:
-            grouped = pd.DataFrame(columns=[groupby, "revenue", "cost", "profit"])
-        else:
-            grouped = fdf.groupby(groupby).agg({"revenue": agg_fn, "cost": agg_fn, "profit": agg_fn}).reset_index()
-
-        # Figure 1
-        fig1 = {
-            "data": [
-                {"type": "bar", "x": grouped[groupby], "y": grouped["revenue"], "name": "Revenue"},
-                {"type": "bar", "x": grouped[groupby], "y": grouped["cost"], "name": "Cost"},
-            ],
-            "layout": {"barmode": "group", "title": f"Revenue/Cost by {groupby.capitalize()}", "paper_bgcolor": "white", "plot_bgcolor": "white"}
+            min_profit = _norm_number(min_profit)
+        except ValueError:
+            return _empty_visuals()
+        if groupby not in _GROUPBY_COLUMNS:
+            return _empty_visuals()
+
+        # Store carries base64 Arrow IPC; dtypes (dates, categoricals) survive the trip
+        df = _store_frame(data_json)
+        fdf = _filter_df(df, start_date, end_date, _norm_list(products), _norm_list(regions), _norm_list(systems),
+                         _norm_list(teams), min_profit, _norm_query(owner_query))
+
+        # KPIs and every figure grouping come out of one fused pass over the filtered arrays.
+        # Figures are then assembled sequentially from its small outputs: that is plain dict
+        # building under the GIL, so a thread pool would only add dispatch overhead.
+        today = pd.Timestamp(end_date if end_date else dt.date.today()).normalize()
+        summary = summarize(fdf, groupby, today)
+
+        kpi_rev = f"${fmt_money(summary.total_revenue)}"
+        kpi_cost = f"${fmt_money(summary.total_cost)}"
+        kpi_profit = f"${fmt_money(summary.total_profit)}"
+        kpi_red = str(summary.red_systems)
+
+        # Figure 1 is drawn in the browser from per-group sums and non-NaN counts, so toggling
+        # Sum/Average re-renders it without a server roundtrip (see assets/dashboard.js)
+        seen = summary.dim_rows > 0
+        dim_data = {
+            "groupby": groupby,
+            "x": summary.dim_labels[seen],
+            "revenue": summary.dim_revenue[seen],
+            "revenue_n": summary.dim_revenue_n[seen],
+            "cost": summary.dim_cost[seen],
+            "cost_n": summary.dim_cost_n[seen],
         }
 
-        # Figure 2
-        if fdf.empty:
-            trend = pd.DataFrame(columns=["date", "profit"])
-        else:
-            trend = fdf.groupby("date")["profit"].sum().reset_index().sort_values("date")
+        # Groupby changes touch figure 1 only; skip building and shipping everything else
+        if _only_dimension_controls_triggered():
+            return no_update, no_update, no_update, no_update, dim_data, no_update, no_update, no_update, no_update
+
+        # Figure 2 (date labels are sorted, so the trend is already chronological)
         fig2 = {
-            "data": [{"type": "scatter", "mode": "lines+markers", "x": trend["date"], "y": trend["profit"], "name": "Profit"}],
+            "data": [{"type": "scatter", "mode": "lines+markers", "x": summary.date_labels, "y": summary.date_profit, "name": "Profit"}],
             "layout": {"title": "Profit Trend", "paper_bgcolor": "white", "plot_bgcolor": "white"}
         }
 
         # Figure 3
-        if fdf.empty:
-            sys_health = pd.DataFrame(columns=["system", "status", "count"])
-        else:
-            sys_health = fdf.groupby(["system", "status"]).size().reset_index(name="count")
         statuses = ["Green", "Amber", "Red"]
         fig3_data = []
         for s in statuses:
-            part = sys_health[sys_health["status"] == s]
-            fig3_data.append({"type": "bar", "x": part["system"], "y": part["count"], "name": s})
+            if s in summary.status_labels:
+                counts = summary.system_status_rows[:, summary.status_labels.get_loc(s)]
+                hit = counts > 0
+                x, y = summary.system_labels[hit], counts[hit]
+            else:
+                x, y = [], []
+            fig3_data.append({"type": "bar", "x": x, "y": y, "name": s})
         fig3 = {"data": fig3_data, "layout": {"barmode": "stack", "title": "System Health", "paper_bgcolor": "white", "plot_bgcolor": "white"}}
 
         # Figure 4
-        if fdf.empty:
-            team_work = pd.DataFrame(columns=["team", "rows"])
-        else:
-            team_work = fdf.groupby("team").size().reset_index(name="rows")
-        fig4 = {"data": [{"type": "bar", "x": team_work["team"], "y": team_work["rows"], "name": "Rows"}],
+        team_hit = summary.team_rows > 0
+        fig4 = {"data": [{"type": "bar", "x": summary.team_labels[team_hit], "y": summary.team_rows[team_hit], "name": "Rows"}],
                 "layout": {"title": "Workload by Team", "paper_bgcolor": "white", "plot_bgcolor": "white"}}
 
-        table_rows = fdf.to_dict(orient="records")
-        return kpi_rev, kpi_cost, kpi_profit, kpi_red, fig1, fig2, fig3, fig4, table_rows
+        # ISO day strings for the table; converted in numpy rather than per-row strftime
+        # The table only gets the most recent rows (the frame is date-sorted); Export CSV has them all
+        table_rows = _table_records(fdf.iloc[-get_settings().table_max_rows:])
+        return kpi_rev, kpi_cost, kpi_profit, kpi_red, dim_data, fig2, fig3, fig4, table_rows
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="dashboard", function_name="dimensionFigure"),
+        Output("rev-by-dim-graph", "figure"),
+        Input("dim-store", "data"),
+        Input("agg-radio", "value"),
+    )
 
     @app.callback(
         Output("download-data", "data"),
         Input("export-btn", "n_clicks"),
-        State("detail-table", "data"),
+        State("data-store", "data"),
+        State("date-range", "start_date"),
+        State("date-range", "end_date"),
+        State("product-dd", "value"),
+        State("region-dd", "value"),
+        State("system-dd", "value"),
+        State("team-dd", "value"),
+        State("min-profit-slider", "value"),
+        State("search-owner", "value"),
         prevent_initial_call=True
     )
-    def export_csv(n_clicks, table_rows):
-        if not n_clicks:
+    def export_csv(n_clicks, data_json, start_date, end_date, products, regions, systems, teams,
+                   min_profit, owner_query):
+        """
+        Export the currently filtered rows. Re-applies the filters to the Arrow store
+        and writes CSV with Arrow's writer instead of rebuilding a frame from table records.
+        """
+        if not n_clicks or not data_json:
+            return no_update
+        try:
+            min_profit = _norm_number(min_profit)
+        except ValueError:
             return no_update
-        df = pd.DataFrame.from_records(table_rows or [])
-        csv = df.to_csv(index=False)
-        return dict(content=csv, filename=f"dashboard_export_{dt.date.today().isoformat()}.csv")
+        fdf = _filter_df(_store_frame(data_json), start_date, end_date, _norm_list(products), _norm_list(regions),
+                         _norm_list(systems), _norm_list(teams), min_profit, _norm_query(owner_query))
+        return dict(content=frame_to_csv(fdf), filename=f"dashboard_export_{dt.date.today().isoformat()}.csv")
@@ -1,5 +1,6 @@
+import functools
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Any, Optional, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -34,6 +35,7 @@ class Settings(BaseSettings):
     api_base_url: str = Field(default="", alias="API_BASE_URL")
     db_url: str = Field(default="", alias="DB_URL")
     max_rows: int = Field(default=7000, ge=1, alias="MAX_ROWS")
+    table_max_rows: int = Field(default=1000, ge=1, alias="TABLE_MAX_ROWS")
 
     # Auth/JWT
     disable_auth: bool = Field(default=False, alias="DISABLE_AUTH")
@@ -55,17 +57,21 @@ class Settings(BaseSettings):
 
 
 # Singleton accessor to avoid repeated disk reads/parsing
-_settings_singleton: Optional[Settings] = None
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the singleton Settings instance, initializing it on first call.
+
+    Tests that change the environment can rebuild it with `get_settings.cache_clear()`.
+    """
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get the singleton Settings instance, initializing it on first call."""
-    global _settings_singleton
-    if _settings_singleton is None:
-        _settings_singleton = Settings()
-    return _settings_singleton
+# Convenience module-level constants used by app.py when running as a script. Resolved
+# lazily on first access so importing this module does not construct Settings.
+_LAZY_SETTINGS = {"PORT": "port", "DEBUG": "debug"}
 
 
-# Convenience module-level constants used by app.py when running as a script
-PORT: int = get_settings().port
-DEBUG: bool = get_settings().debug
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SETTINGS:
+        return getattr(get_settings(), _LAZY_SETTINGS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ import pandas as pd
 
 from .config import get_settings
 from .datasources import DataRepository
+from .utils import today_key
 
 # Module-level cache kept for backward compatibility, though repository manages caching internally.
 _cache: Optional[Cache] = None
@@ -30,3 +31,18 @@ def get_data(force_key: Optional[str] = None) -> pd.DataFrame:
     capping, normalization, and caching.
     """
     return _repo.get_data(force_key)
+
+
+def get_data_for_team(team: str, force_key: Optional[str] = None) -> pd.DataFrame:
+    """Team-scoped variant of `get_data` used for Developer RBAC narrowing."""
+    return _repo.get_data_for_team(team, force_key)
+
+
+def warm_cache() -> None:
+    """Populate today's cache entry ahead of the first request.
+
+    Called from the gunicorn master (see gunicorn.conf.py) so that, with `preload_app`,
+    forked workers inherit a filled in-process cache instead of the first callback paying
+    for the provider load.
+    """
+    _repo.load_cached(today_key())
@@ -3,14 +3,14 @@
 Public exports:
 - DataProvider protocol
 - SyntheticProvider, RestProvider, SqlProvider
-- CacheFacade
+- CacheFacade, CacheStore protocol
 - DataRepository
 """
 from .base import DataProvider
 from .synthetic import SyntheticProvider
 from .rest import RestProvider
 from .sql import SqlProvider
-from .cache import CacheFacade
+from .cache import CacheFacade, CacheStore
 from .repository import DataRepository
 
 __all__ = [
@@ -19,5 +19,6 @@ __all__ = [
     "RestProvider",
     "SqlProvider",
     "CacheFacade",
+    "CacheStore",
     "DataRepository",
 ]
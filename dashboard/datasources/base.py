@@ -1,7 +1,65 @@
-from typing import Protocol
+import os
+import weakref
+from typing import Callable, List, Protocol
 
 import pandas as pd
 
+# Low-cardinality label columns; the repository stores them as categoricals
+DIMENSION_COLUMNS = ("product", "region", "system", "team", "owner", "status")
+
+
+def normalize_dimensions(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the dimension columns present in `df` to categoricals, in place.
+
+    Categories are the observed labels in sorted order and the dtype is marked ordered,
+    so UI options come straight from `.cat.categories` and sorting a column compares
+    integer codes. Already-normalized columns pass through without re-sorting. Labels of
+    mixed types (e.g. ints and strings from a loosely typed JSON source) cannot be
+    ordered, so such columns are compared as their string form.
+    """
+    for col in DIMENSION_COLUMNS:
+        if col in df.columns:
+            cat = df[col].astype("category").cat.remove_unused_categories()
+            categories = cat.cat.categories
+            try:
+                if not categories.is_monotonic_increasing:
+                    cat = cat.cat.reorder_categories(categories.sort_values())
+            except TypeError:  # unorderable mixed labels
+                cat = df[col].map(str, na_action="ignore").astype("category")
+                cat = cat.cat.reorder_categories(cat.cat.categories.sort_values())
+            df[col] = cat.cat.as_ordered()
+    return df
+
+
+# Bound methods to run in forked children; weak, so providers can still be collected
+_after_fork: List[weakref.WeakMethod] = []
+
+
+def _run_after_fork() -> None:
+    live = []
+    for ref in _after_fork:
+        method = ref()
+        if method is not None:
+            method()
+            live.append(ref)
+    _after_fork[:] = live
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_run_after_fork)
+
+
+def register_after_fork(method: Callable[[], None]) -> None:
+    """Call the bound `method` in every forked child while its object is alive.
+
+    gunicorn's master warms the cache before forking workers (`preload_app`), so pooled
+    connections opened there must be dropped in each child rather than shared. One
+    process-wide fork hook walks a registry of weak references, so registering does not
+    keep the object alive and repeated construction does not pile up hooks.
+    """
+    _after_fork[:] = [ref for ref in _after_fork if ref() is not None]
+    _after_fork.append(weakref.WeakMethod(method))
+
 
 class DataProvider(Protocol):
     """Protocol for data providers returning a pandas DataFrame."""
@@ -1,21 +1,47 @@
 from __future__ import annotations
 
-from typing import Callable, Any, Optional
+import functools
+from typing import Callable, Any, Hashable, Optional, Protocol, Union
 
 from flask_caching import Cache
 
 
+class CacheStore(Protocol):
+    """Minimal key/value store accepted by `CacheFacade` in place of Flask-Caching."""
+
+    def get(self, key: Hashable) -> Any: ...
+
+    def set(self, key: Hashable, value: Any, timeout: Optional[int] = None) -> Any: ...
+
+
 class CacheFacade:
     """Thin wrapper over Flask-Caching to make caching injectable and optional.
 
     When no cache is provided, `memoize` is a no-op and returns the wrapped function.
+    A plain `CacheStore` (e.g. a dict-backed object) may be passed instead of a Flask
+    `Cache`; it is used directly, skipping Flask-Caching's key hashing and pickling.
     """
 
-    def __init__(self, cache: Optional[Cache], timeout_seconds: int) -> None:
+    def __init__(self, cache: Optional[Union[Cache, CacheStore]], timeout_seconds: int) -> None:
         self.cache = cache
         self.timeout_seconds = timeout_seconds
 
     def memoize(self, fn: Callable[..., Any]) -> Callable[..., Any]:
         if self.cache is None:
             return fn
-        return self.cache.memoize(timeout=self.timeout_seconds)(fn)
+        if isinstance(self.cache, Cache):
+            return self.cache.memoize(timeout=self.timeout_seconds)(fn)
+
+        store = self.cache
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            value = store.get(key)
+            if value is None:
+                value = fn(*args, **kwargs)
+                store.set(key, value, timeout=self.timeout_seconds)
+            return value
+
+        return wrapper
@@ -0,0 +1,62 @@
+"""Arrow IPC (de)serialization for DataFrames crossing the cache and `dcc.Store` boundaries."""
+import base64
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+# Store payloads travel to the browser and back on every callback, so they are compressed;
+# cache entries stay uncompressed so they decode as zero-copy views
+STORE_COMPRESSION = "zstd"
+
+
+def frame_to_ipc(df: pd.DataFrame, compression: Optional[str] = None) -> bytes:
+    """Serialize a DataFrame to an Arrow IPC stream.
+
+    Categorical columns are written as dictionary-encoded arrays, so the payload
+    carries each distinct label once plus the integer codes. `compression` ("lz4" or
+    "zstd") compresses each buffer; readers decompress transparently.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def frame_from_ipc(buf: bytes) -> pd.DataFrame:
+    """Decode an Arrow IPC stream produced by `frame_to_ipc`.
+
+    `split_blocks=True` lets numeric, datetime and dictionary-index columns come back as
+    zero-copy numpy views over the Arrow buffers instead of consolidated copies. Those
+    views are read-only: callers that need to modify the frame must `.copy()` it first.
+    """
+    return pa.ipc.open_stream(buf).read_all().to_pandas(split_blocks=True)
+
+
+def frame_to_b64(df: pd.DataFrame) -> str:
+    """Encode a DataFrame as base64 Arrow IPC text for JSON transports such as `dcc.Store`."""
+    return base64.b64encode(frame_to_ipc(df, compression=STORE_COMPRESSION)).decode("ascii")
+
+
+def frame_from_b64(payload: str) -> pd.DataFrame:
+    """Inverse of `frame_to_b64`."""
+    return frame_from_ipc(base64.b64decode(payload))
+
+
+def frame_to_csv(df: pd.DataFrame, date_columns: tuple = ("date",)) -> str:
+    """Render a DataFrame as CSV text with Arrow's vectorized writer.
+
+    `date_columns` hold whole days and are written as ISO dates rather than timestamps.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in date_columns:
+        if name in table.column_names and pa.types.is_timestamp(table.schema.field(name).type):
+            i = table.schema.get_field_index(name)
+            table = table.set_column(i, name, table.column(i).cast(pa.date32()))
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(table, sink, write_options=pa_csv.WriteOptions(quoting_style="needed"))
+    return sink.getvalue().to_pybytes().decode("utf-8")
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from flask_caching import Cache
 
 from ..config import Settings, get_settings
 from ..utils import today_key
-from .base import DataProvider
+from .base import DataProvider, normalize_dimensions
 from .cache import CacheFacade
+from .ipc import frame_from_ipc, frame_to_ipc
 from .rest import RestProvider
 from .sql import SqlProvider
 from .synthetic import SyntheticProvider
@@ -40,21 +42,44 @@ class DataRepository:
     def load_uncached(self) -> pd.DataFrame:
         df = self.provider.load()
         if len(df) > self.settings.max_rows:
-            df = df.sample(self.settings.max_rows, random_state=1).reset_index(drop=True)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+            # Sorted positions turn the gather into a forward scan; the index is dropped on serialization
+            rng = np.random.default_rng(1)
+            idx = np.sort(rng.choice(len(df), self.settings.max_rows, replace=False))
+            df = df.take(idx)
+        # Naive datetime64 day values, sorted, so date ranges can be binary-searched downstream.
+        # Zoned timestamps (e.g. ISO "...Z") keep their wall-clock day and drop the zone
+        dates = pd.to_datetime(df["date"])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        df["date"] = dates.dt.normalize()
+        df = df.sort_values("date", kind="stable", ignore_index=True)
+        # Re-run after sampling so categories only list labels that survived the cap
+        return normalize_dimensions(df)
 
     def load_cached(self, day_key: str) -> pd.DataFrame:
+        # The cache holds Arrow IPC bytes rather than a pickled DataFrame; the decoded frame
+        # is a read-only view over those bytes, so it can be shared without a defensive copy.
         @self.cache_facade.memoize
-        def _inner(_k: str) -> pd.DataFrame:  # pragma: no cover - thin wrapper
-            return self.load_uncached()
+        def _inner(_k: str) -> bytes:  # pragma: no cover - thin wrapper
+            return frame_to_ipc(self.load_uncached())
 
-        return _inner(day_key)
+        return frame_from_ipc(_inner(day_key))
 
     def get_data(self, force_key: Optional[str] = None) -> pd.DataFrame:
         key = force_key if force_key else today_key()
-        df = self.load_cached(key)
-        return df.copy()
+        return self.load_cached(key)
+
+    def get_data_for_team(self, team: str, force_key: Optional[str] = None) -> pd.DataFrame:
+        """Rows for a single team (RBAC narrowing).
+
+        Matches the team's categorical code instead of comparing strings, and returns the
+        rows without a defensive copy since the cached frame is read-only.
+        """
+        df = self.get_data(force_key)
+        teams = df["team"].cat.categories
+        if team not in teams:
+            return df.iloc[:0]
+        return df[df["team"].cat.codes.to_numpy() == teams.get_loc(team)]
 
     # ---- Cache wiring ----
     def set_cache(self, cache: Cache) -> None:
@@ -1,10 +1,15 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pa_json
 import requests
 
 from ..config import Settings, get_settings
+from .base import normalize_dimensions, register_after_fork
 from .synthetic import SyntheticProvider
 
 
@@ -13,6 +18,29 @@ class RestProvider:
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
+        self._session: Optional[requests.Session] = None
+        register_after_fork(self._reset_after_fork)
+
+    def _reset_after_fork(self) -> None:
+        # The parent's keep-alive sockets must not be shared; the child opens its own
+        self._session = None
+
+    def _get_session(self) -> requests.Session:
+        # One pooled keep-alive session per provider instead of a fresh connection per fetch
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def _fetch(self, url: str) -> pd.DataFrame:
+        resp = self._get_session().get(url, timeout=30)
+        resp.raise_for_status()
+        if "ndjson" in resp.headers.get("Content-Type", ""):
+            # Newline-delimited JSON goes straight through Arrow's C++ parser into columns
+            return pa_json.read_json(pa.BufferReader(resp.content)).to_pandas()
+        # Record lists may omit keys per row and column-oriented dicts are also accepted;
+        # the DataFrame constructor takes the union of keys for both shapes and keeps
+        # mixed-type columns as object
+        return pd.DataFrame(orjson.loads(resp.content))
 
     def _endpoints(self) -> List[str]:
         base = (self.settings.api_base_url or "").rstrip("/")
@@ -25,21 +53,18 @@ class RestProvider:
         if not endpoints:
             return SyntheticProvider(self.settings).load()
 
-        frames: list[pd.DataFrame] = []
-        for url in endpoints:
-            resp = requests.get(url, timeout=30)
-            resp.raise_for_status()
-            frames.append(pd.DataFrame(resp.json()))
-
-        if not frames:
-            return SyntheticProvider(self.settings).load()
-
-        df = pd.concat(frames, ignore_index=True)
+        # Endpoints are fetched concurrently; pages whose columns inferred differently
+        # (int vs float, missing keys) are unified by the concat
+        if len(endpoints) == 1:
+            df = self._fetch(endpoints[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(endpoints))) as pool:
+                df = pd.concat(pool.map(self._fetch, endpoints), ignore_index=True)
 
         needed = {"date", "product", "region", "system", "team", "owner", "status", "revenue", "cost"}
         for col in needed - set(df.columns):
             df[col] = np.nan  # type: ignore[name-defined]
 
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df["date"] = pd.to_datetime(df["date"])  # datetime64, not object `datetime.date`s
         df["profit"] = df["revenue"] - df["cost"]
-        return df
+        return normalize_dimensions(df)
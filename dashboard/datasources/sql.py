@@ -1,29 +1,58 @@
+import datetime as dt
+from typing import Optional
+
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 
 from ..config import Settings, get_settings
+from .base import normalize_dimensions, register_after_fork
 from .synthetic import SyntheticProvider
 
+# Oldest day the dashboard's date picker can select; older rows are never shown
+LOOKBACK_DAYS = 365
+
 
 class SqlProvider:
     """Loads data from SQL database defined by DB_URL setting."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
+        self._engine: Optional[Engine] = None
+        register_after_fork(self._reset_after_fork)
+
+    def _reset_after_fork(self) -> None:
+        # Forget the parent's pooled connections without closing them under the parent
+        if self._engine is not None:
+            self._engine.dispose(close=False)
+
+    def _get_engine(self) -> Engine:
+        # One connection pool per provider; refreshes reuse it instead of reconnecting
+        if self._engine is None:
+            self._engine = create_engine(self.settings.db_url, pool_pre_ping=True)
+        return self._engine
 
     def load(self) -> pd.DataFrame:
         if not self.settings.db_url:
             return SyntheticProvider(self.settings).load()
-        engine = create_engine(self.settings.db_url, pool_pre_ping=True)
-        sql = (
+        # The date window and row cap run in the database, so only rows the
+        # dashboard can display cross the wire (most recent first when capped)
+        sql = text(
             """
             SELECT
                 CAST(date AS DATE) AS date,
                 product, region, system, team, owner, status,
-                revenue::float AS revenue, cost::float AS cost
+                revenue::float AS revenue, cost::float AS cost,
+                (revenue - cost)::float AS profit
             FROM analytics_facts
+            WHERE date >= :start_date
+            ORDER BY date DESC
+            LIMIT :max_rows
             """
         )
-        df = pd.read_sql(sql, engine)
-        df["profit"] = df["revenue"] - df["cost"]
-        return df
+        params = {
+            "start_date": dt.date.today() - dt.timedelta(days=LOOKBACK_DAYS),
+            "max_rows": self.settings.max_rows,
+        }
+        df = pd.read_sql(sql, self._get_engine(), params=params, parse_dates=["date"])
+        return normalize_dimensions(df)
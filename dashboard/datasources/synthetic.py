@@ -23,16 +23,45 @@ class SyntheticProvider:
         teams = ["Platform", "Retail", "Corporate", "Data", "Integration"]
         owners = ["alice", "bob", "carol", "dave", "erin"]
         statuses = ["Green", "Amber", "Red"]
-        df = pd.DataFrame({
-            "date": rng.choice(days, size=rows),
-            "product": rng.choice(products, size=rows),
-            "region": rng.choice(regions, size=rows),
-            "system": rng.choice(systems, size=rows),
-            "team": rng.choice(teams, size=rows),
-            "owner": rng.choice(owners, size=rows),
-            "status": rng.choice(statuses, size=rows, p=[0.7, 0.2, 0.1]),
-            "revenue": (rng.normal(100000, 25000, size=rows)).clip(min=1000),
-            "cost": (rng.normal(60000, 15000, size=rows)).clip(min=500),
-        })
-        df["profit"] = df["revenue"] - df["cost"]
-        return df
+
+        def categorical(categories: list[str]) -> pd.Categorical:
+            # Draw small integer codes instead of sampling Python strings
+            codes = rng.integers(0, len(categories), size=rows, dtype=np.int8)
+            return pd.Categorical.from_codes(codes, categories)
+
+        # Numeric columns are drawn straight into float64 buffers and scaled in place
+        revenue = np.empty(rows, dtype=np.float64)
+        rng.standard_normal(out=revenue)
+        np.multiply(revenue, 25000, out=revenue)
+        np.add(revenue, 100000, out=revenue)
+        np.clip(revenue, 1000, None, out=revenue)
+
+        cost = np.empty(rows, dtype=np.float64)
+        rng.standard_normal(out=cost)
+        np.multiply(cost, 15000, out=cost)
+        np.add(cost, 60000, out=cost)
+        np.clip(cost, 500, None, out=cost)
+
+        profit = np.empty(rows, dtype=np.float64)
+        np.subtract(revenue, cost, out=profit)
+
+        status_codes = rng.choice(len(statuses), size=rows, p=[0.7, 0.2, 0.1]).astype(np.int8)
+
+        # Every other column is drawn independently of the date, so emitting day codes in
+        # sorted order gives the same distribution and lets the repository's stable sort
+        # by date run over already-ordered data
+        day_codes = rng.integers(0, len(days), size=rows, dtype=np.int16)
+        day_codes.sort()
+
+        return pd.DataFrame({
+            "date": days.values[day_codes],
+            "product": categorical(products),
+            "region": categorical(regions),
+            "system": categorical(systems),
+            "team": categorical(teams),
+            "owner": categorical(owners),
+            "status": pd.Categorical.from_codes(status_codes, statuses),
+            "revenue": revenue,
+            "cost": cost,
+            "profit": profit,
+        }, copy=False)
@@ -1,12 +1,37 @@
 import datetime as dt
+import functools
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_caching import Cache
 from dash import Dash
-from typing import Optional
+from typing import Any, Optional
+
+import orjson
+import plotly.io as pio
 
 from .config import Settings, get_settings
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Datetimes are passed through to Flask's default hook so HTTP-date formatting is unchanged.
+    """
+
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._options
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 class ServerFactory:
     """Class-based factory for Flask server, Cache, and Dash app."""
 
@@ -16,6 +41,7 @@ class ServerFactory:
 
     def create_server(self) -> Flask:
         server = Flask(__name__)
+        server.json = OrjsonProvider(server)
 
         @server.route("/health")
         def health():
@@ -32,6 +58,8 @@ class ServerFactory:
         return cache
 
     def create_app(self, server: Flask) -> Dash:
+        # Dash serializes layouts and callback outputs through plotly.io.json; pin its orjson engine
+        pio.json.config.default_engine = "orjson"
         app = Dash(
             __name__,
             server=server,
@@ -42,17 +70,22 @@ class ServerFactory:
         return app
 
 
-# Backward-compatible function wrappers using a shared factory instance
+# Backward-compatible function wrappers using a shared factory instance. They are memoized
+# so repeated calls (e.g. re-imports, gunicorn preload + worker hooks) reuse the process-wide
+# server, cache and app instead of building and registering them again.
 _factory = ServerFactory()
 
 
+@functools.cache
 def create_server() -> Flask:
     return _factory.create_server()
 
 
+@functools.cache
 def create_cache(server: Flask) -> Cache:
     return _factory.create_cache(server)
 
 
+@functools.cache
 def create_app(server: Flask) -> Dash:
     return _factory.create_app(server)
@@ -1,10 +1,31 @@
 import datetime as dt
+import functools
 from typing import Optional
 from dash import dcc, html, dash_table
 
 from .config import get_settings
 from .auth import current_claims
 from .data import get_data
+from .utils import today_key
+
+# Developer View table columns (constant; built once at import)
+_DETAIL_COLUMNS = ("date", "product", "region", "system", "team", "owner", "status", "revenue", "cost", "profit")
+_DETAIL_COLUMN_SPEC = tuple({"name": c, "id": c} for c in _DETAIL_COLUMNS)
+
+# Date picker bounds relative to today: selectable range and default window
+_YEAR = dt.timedelta(days=365)
+_MONTH = dt.timedelta(days=30)
+
+# Persona bits: each role sees exactly one tab; KPI cards show for CIO and Architect
+_CIO, _ARCH, _DEV = 0b100, 0b010, 0b001
+_ROLE_BITS = {"CIO": _CIO, "Architect": _ARCH, "Developer": _DEV}
+_TAB_VALUE = {_CIO: "cio", _ARCH: "arch", _DEV: "dev"}
+_KPI_BITS = _CIO | _ARCH
+
+
+def _role_bits(role: Optional[str]) -> int:
+    """Persona bit for `role`; unknown or missing roles get the Developer view."""
+    return _ROLE_BITS.get(role, _DEV)
 
 
 class UIBuilder:
@@ -33,25 +54,15 @@ class UIBuilder:
 
     def build_layout(self):
         claims = current_claims()
-        role = claims.get("role", "Developer")
+        role = claims.get("role") or "Developer"
         user_name = claims.get("name", claims.get("sub", "User"))
-
-        # Pre-populate controls options from today's data (server-side render)
-        df = get_data()  # small data; safe to sample columns
-        products = sorted(df["product"].dropna().unique().tolist())
-        regions = sorted(df["region"].dropna().unique().tolist())
-        systems = sorted(df["system"].dropna().unique().tolist())
-        teams = sorted(df["team"].dropna().unique().tolist())
-
-        # Role-based visibility helpers
-        show_cio = role == "CIO"
-        show_arch = role == "Architect"
-        show_dev = role == "Developer"
+        bits = _role_bits(role)
 
         return html.Div([
             # Store claims and bootstrap data to the client (per-request, role-aware)
-            dcc.Store(id="claims-store", data=claims),
+            _claims_store(tuple(sorted((k, v) for k, v in claims.items() if k != "exp"))),
             dcc.Store(id="data-store"),  # filled by a callback on load/refresh
+            dcc.Store(id="dim-store"),  # per-group sums; figure 1 is drawn client-side
             dcc.Download(id="download-data"),
 
             html.Div([
@@ -60,88 +71,143 @@ class UIBuilder:
             ], style={"display": "flex", "flexDirection": "column", "gap": "4px", "marginBottom": "12px"}),
 
             # ==== Filters / Controls (Interactive Elements) ====
-            html.Div([
-                dcc.DatePickerRange(
-                    id="date-range",
-                    min_date_allowed=(dt.date.today() - dt.timedelta(days=365)),
-                    max_date_allowed=dt.date.today(),
-                    start_date=(dt.date.today() - dt.timedelta(days=30)),
-                    end_date=dt.date.today(),
-                    display_format="YYYY-MM-DD",
-                ),
-                dcc.Dropdown(products, products[:2], id="product-dd", placeholder="Select products", multi=True, style={"minWidth": "220px"}),
-                dcc.Dropdown(regions, regions[:2], id="region-dd", placeholder="Select regions", multi=True, style={"minWidth": "220px"}),
-                dcc.Dropdown(systems, None, id="system-dd", placeholder="System (optional)", multi=True, style={"minWidth": "220px"}),
-                dcc.Dropdown(teams, None, id="team-dd", placeholder="Team (optional)", multi=True, style={"minWidth": "220px"}),
-
-                dcc.Slider(id="min-profit-slider", min=-100000, max=200000, step=1000, value=0,
-                           tooltip={"always_visible": False, "placement": "bottom"}),
-
-                dcc.RadioItems(
-                    id="agg-radio", options=[{"label": "Sum", "value": "sum"}, {"label": "Average", "value": "mean"}],
-                    value="sum", inline=True
-                ),
-                dcc.Input(id="search-owner", placeholder="Search owner...", type="text"),
-
-                dcc.Dropdown(
-                    id="groupby-dd",
-                    options=[{"label": l, "value": v} for v, l in [
-                        ("date", "By Date"), ("product", "By Product"), ("region", "By Region"),
-                        ("system", "By System"), ("team", "By Team"), ("status", "By Status")
-                    ]],
-                    value="date", clearable=False, style={"minWidth": "220px"}
-                ),
-
-                html.Button("Refresh Data", id="refresh-btn", n_clicks=0),
-                html.Button("Export CSV", id="export-btn", n_clicks=0),
-            ], style={"display": "grid", "gridTemplateColumns": "repeat(4, minmax(220px, 1fr))", "gap": "10px", "alignItems": "center"}),
+            _controls(today_key(), *_option_labels()),
 
             html.Hr(),
 
             # ==== KPI Cards (CIO + Architects by default) ====
             html.Div(
                 id="kpi-row",
-                children=[
-                    UIBuilder.kpi_card("Total Revenue", "—", "rev"),
-                    UIBuilder.kpi_card("Total Cost", "—", "cost"),
-                    UIBuilder.kpi_card("Total Profit", "—", "profit"),
-                    UIBuilder.kpi_card("Red Systems (today)", "—", "red"),
-                ],
-                style={"display": ("flex" if (show_cio or show_arch) else "none"),
+                children=_kpi_cards(),
+                style={"display": ("flex" if bits & _KPI_BITS else "none"),
                        "gap": "12px", "flexWrap": "wrap", "marginBottom": "8px"}
             ),
 
             # ==== Tabs by Persona ====
-            dcc.Tabs(id="tabs", value=("cio" if show_cio else "arch" if show_arch else "dev"), children=[
-                dcc.Tab(label="CIO Overview", value="cio", children=[
-                    dcc.Graph(id="rev-by-dim-graph"),        # Interactive graph (click/hover)
-                    dcc.Graph(id="trend-graph"),             # Time series
-                ], disabled=not show_cio),
-
-                dcc.Tab(label="Architecture View", value="arch", children=[
-                    dcc.Graph(id="system-health-graph"),     # System status/health aggregation
-                    dcc.Graph(id="team-workload-graph"),     # Workload by team/system
-                ], disabled=not show_arch),
-
-                dcc.Tab(label="Developer View", value="dev", children=[
-                    dash_table.DataTable(
-                        id="detail-table",
-                        columns=[{"name": c, "id": c} for c in
-                                 ["date", "product", "region", "system", "team", "owner", "status", "revenue", "cost", "profit"]],
-                        page_size=15,
-                        sort_action="native",
-                        filter_action="native",
-                        column_selectable="single",
-                        style_table={"overflowX": "auto"},
-                        style_cell={"minWidth": 80, "maxWidth": 200, "whiteSpace": "nowrap", "textOverflow": "ellipsis"}
-                    )
-                ], disabled=not show_dev),
-            ]),
+            _tabs(bits),
 
             html.Div(id="debug-msg", style={"fontSize": "12px", "color": "#999", "marginTop": "6px"}),
 
         ])
 
 
+def _options(labels: list) -> list:
+    """Dropdown options in the `{label, value}` form the client would otherwise build."""
+    return [{"label": v, "value": v} for v in labels]
+
+
+@functools.lru_cache(maxsize=256)
+def _claims_store(items: tuple) -> dcc.Store:
+    """Client-side claims store for one identity.
+
+    Callbacks only read role/team, so `exp` (which changes per token and hourly for the
+    dev defaults) is dropped by the caller; the remaining claims are stable per user and the
+    store component is reused across that user's page loads.
+    """
+    return dcc.Store(id="claims-store", data=dict(items))
+
+
+def _option_labels() -> tuple:
+    """Dropdown labels (products, regions, systems, teams) of the currently loaded data.
+
+    Dimension columns are categoricals whose categories the repository already sorted and
+    pruned to observed labels, so each list is read off the dtype with no row scan.
+    """
+    df = get_data()
+    return tuple(tuple(df[c].cat.categories) for c in ("product", "region", "system", "team"))
+
+
+@functools.lru_cache(maxsize=8)
+def _controls(day_key: str, products: tuple, regions: tuple, systems: tuple, teams: tuple) -> html.Div:
+    """Filter controls for one day (`today_key()`, an ISO date) and set of option labels.
+
+    The key carries the loaded data's labels, so a cache refresh that adds a product or
+    team shows up on the next page load. The tree does not depend on the viewer and is
+    shared across requests; Dash only serializes it, never mutates it.
+    """
+    products, regions, systems, teams = map(list, (products, regions, systems, teams))
+    today = dt.date.fromisoformat(day_key)
+
+    return html.Div([
+        dcc.DatePickerRange(
+            id="date-range",
+            min_date_allowed=today - _YEAR,
+            max_date_allowed=today,
+            start_date=today - _MONTH,
+            end_date=today,
+            display_format="YYYY-MM-DD",
+        ),
+        dcc.Dropdown(options=_options(products), value=products[:2], id="product-dd", placeholder="Select products", multi=True, style={"minWidth": "220px"}),
+        dcc.Dropdown(options=_options(regions), value=regions[:2], id="region-dd", placeholder="Select regions", multi=True, style={"minWidth": "220px"}),
+        dcc.Dropdown(options=_options(systems), value=None, id="system-dd", placeholder="System (optional)", multi=True, style={"minWidth": "220px"}),
+        dcc.Dropdown(options=_options(teams), value=None, id="team-dd", placeholder="Team (optional)", multi=True, style={"minWidth": "220px"}),
+
+        dcc.Slider(id="min-profit-slider", min=-100000, max=200000, step=1000, value=0,
+                   tooltip={"always_visible": False, "placement": "bottom"}),
+
+        dcc.RadioItems(
+            id="agg-radio", options=[{"label": "Sum", "value": "sum"}, {"label": "Average", "value": "mean"}],
+            value="sum", inline=True
+        ),
+        dcc.Input(id="search-owner", placeholder="Search owner...", type="text"),
+
+        dcc.Dropdown(
+            id="groupby-dd",
+            options=[{"label": l, "value": v} for v, l in [
+                ("date", "By Date"), ("product", "By Product"), ("region", "By Region"),
+                ("system", "By System"), ("team", "By Team"), ("status", "By Status")
+            ]],
+            value="date", clearable=False, style={"minWidth": "220px"}
+        ),
+
+        html.Button("Refresh Data", id="refresh-btn", n_clicks=0),
+        html.Button("Export CSV", id="export-btn", n_clicks=0),
+    ], style={"display": "grid", "gridTemplateColumns": "repeat(4, minmax(220px, 1fr))", "gap": "10px", "alignItems": "center"})
+
+
+@functools.lru_cache(maxsize=8)
+def _tabs(bits: int) -> dcc.Tabs:
+    """Persona tabs for one role's `_role_bits`, built once per persona.
+
+    The default tab and the disabled flags are the only role-dependent parts, so each
+    persona's tree is shared across requests like the controls.
+    """
+    return dcc.Tabs(id="tabs", value=_TAB_VALUE[bits], children=[
+        dcc.Tab(label="CIO Overview", value="cio", children=[
+            dcc.Graph(id="rev-by-dim-graph"),        # Interactive graph (click/hover)
+            dcc.Graph(id="trend-graph"),             # Time series
+        ], disabled=not bits & _CIO),
+
+        dcc.Tab(label="Architecture View", value="arch", children=[
+            dcc.Graph(id="system-health-graph"),     # System status/health aggregation
+            dcc.Graph(id="team-workload-graph"),     # Workload by team/system
+        ], disabled=not bits & _ARCH),
+
+        dcc.Tab(label="Developer View", value="dev", children=[
+            dash_table.DataTable(
+                id="detail-table",
+                columns=list(_DETAIL_COLUMN_SPEC),
+                page_size=15,
+                sort_action="native",
+                filter_action="native",
+                column_selectable="single",
+                style_table={"overflowX": "auto"},
+                style_cell={"minWidth": 80, "maxWidth": 200, "whiteSpace": "nowrap", "textOverflow": "ellipsis"}
+            )
+        ], disabled=not bits & _DEV),
+    ])
+
+
+@functools.cache
+def _kpi_cards() -> list:
+    """Static KPI cards; values are filled in by callbacks."""
+    return [
+        UIBuilder.kpi_card("Total Revenue", "—", "rev"),
+        UIBuilder.kpi_card("Total Cost", "—", "cost"),
+        UIBuilder.kpi_card("Total Profit", "—", "profit"),
+        UIBuilder.kpi_card("Red Systems (today)", "—", "red"),
+    ]
+
+
 def serve_layout():
     return UIBuilder().build_layout()
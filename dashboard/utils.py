@@ -1,15 +1,41 @@
 import datetime as dt
+import math
+import time
+from typing import Tuple
+
+
+# (day start, next midnight) epoch seconds and the key; rebound as a whole so readers
+# never see a torn tuple
+_today_cache: Tuple[float, float, str] = (0.0, 0.0, "")
 
 
 def today_key() -> str:
-    """Cache-busting key that changes daily."""
-    return dt.date.today().isoformat()
+    """Cache-busting key that changes daily.
+
+    The ISO date string is reused while the clock stays within that local day, so the
+    common path is one `time.time()` call and two float compares instead of building and
+    formatting a date. A clock stepped back before the day's start (NTP, frozen time in
+    tests) recomputes as well.
+    """
+    global _today_cache
+    day_start, expires_at, key = _today_cache
+    now = time.time()
+    if not day_start <= now < expires_at:
+        today = dt.date.today()
+        start = dt.datetime.combine(today, dt.time())
+        midnight = dt.datetime.combine(today + dt.timedelta(days=1), dt.time())
+        key = today.isoformat()
+        _today_cache = (start.timestamp(), midnight.timestamp(), key)
+    return key
+
+
+_MONEY_UNITS = ("", "K", "M", "B", "T")
 
 
 def fmt_money(x: float) -> str:
-    """Compact human-readable money formatting (e.g., 12.3K, 7M)."""
-    for unit in ["", "K", "M", "B"]:
-        if abs(x) < 1000.0:
-            return f"{x:,.0f}{unit}"
-        x /= 1000.0
-    return f"{x:,.0f}T"
+    """Compact human-readable money formatting, rounded to whole units (e.g., 12K, 7M)."""
+    if not x or not math.isfinite(x):
+        return f"{x:,.0f}"
+    # Thousands-group index straight from the magnitude: one log10 and one division
+    mag = min(max(int(math.log10(abs(x)) // 3), 0), len(_MONEY_UNITS) - 1)
+    return f"{x / 1000.0 ** mag:,.0f}{_MONEY_UNITS[mag]}"
@@ -1,16 +1,62 @@
-worker_class = "uvicorn_worker.UvicornWorker"
-workers = 2  # tune via load tests
+import math
+import os
+
+
+def _cgroup_cpu_quota(path: str = "/sys/fs/cgroup/cpu.max") -> int | None:
+    """CPUs granted by a cgroup v2 quota (``"<quota> <period>"``, rounded up), or None if unlimited/unknown."""
+    try:
+        with open(path) as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return max(1, math.ceil(int(quota) / int(period)))
+
+
+def _available_cpus() -> int:
+    """CPUs this process may use: the affinity mask, capped by a container CPU quota.
+
+    Affinity alone reports the host's cores inside a pod with a CPU limit, so the cgroup
+    quota is read too and the smaller of the two wins.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 2
+    quota = _cgroup_cpu_quota()
+    return min(cpus, quota) if quota else cpus
+
+
+# Dash/Flask is WSGI, so ASGI workers (uvicorn) do not apply; callbacks mostly wait on
+# cache, SQL and REST I/O, which suits threaded workers. One worker per available core
+# (container CPU limit included, at least 2) scales with the pod; set WEB_CONCURRENCY=1 to leave scaling to replicas.
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", str(max(2, _available_cpus()))))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# Import the app once in the master so workers fork with the app and its modules already loaded (shared copy-on-write)
+preload_app = True
 bind = "0.0.0.0:8000"
 timeout = 60
 graceful_timeout = 30
 keepalive = 5
 forwarded_allow_ips = "10.0.0.0/8,127.0.0.1"
 
-# hygiene
-max_requests = 2000
-max_requests_jitter = 200
+# hygiene: recycle workers periodically to contain slow leaks
+max_requests = 1000
+max_requests_jitter = 100
 
 # security limits
 limit_request_fields = 100
 limit_request_field_size = 8190   # adjust prudently
 # limit_request_line = 4094       # enable when needed
+
+
+def when_ready(server):
+    """Prime today's data cache in the master before workers fork (needs preload_app)."""
+    try:
+        from dashboard.data import warm_cache
+
+        warm_cache()
+    except Exception as e:  # noqa: BLE001 - a cold cache is not fatal; the first request will fill it
+        server.log.warning("Data cache warm-up failed: %s", e)
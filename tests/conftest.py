@@ -1,11 +1,9 @@
 import os
 import threading
-import time
 from contextlib import contextmanager
 from typing import Iterator
 
 import pytest
-import requests
 
 # Ensure predictable dev-like environment before importing the app
 os.environ.setdefault("APP_ENV", "dev")
@@ -18,6 +16,14 @@ os.environ.setdefault("CACHE_TIMEOUT_SECONDS", "5")
 os.environ.setdefault("MAX_ROWS", "200")
 
 
+@pytest.fixture(scope="session")
+def settings():
+    """Process-wide Settings (read once from the env set above)."""
+    from dashboard.config import get_settings
+
+    return get_settings()
+
+
 @pytest.fixture(scope="session")
 def dash_app_and_server():
     """Import the app after env is set; expose Dash app and Flask server."""
@@ -35,42 +41,25 @@ def flask_client(dash_app_and_server):
 
 @contextmanager
 def run_server_in_thread(port: int) -> Iterator[str]:
-    """Run the Dash development server in a background thread for E2E tests.
+    """Run the Dash app's Flask server in a background thread for E2E tests.
 
-    Returns the base URL. The server is stopped when the context exits by
-    setting the Dash internal Flask server shutdown flag via requests to /shutdown
-    is not available in Dash; instead we rely on daemon thread termination at process end.
+    Returns the base URL. `make_server` binds and listens before returning, so the server
+    is ready as soon as it is constructed: requests made before `serve_forever` starts
+    simply wait in the listen backlog, and no readiness polling is needed. The server is
+    shut down when the context exits.
     """
-    from dashboard import app as dash_app  # import here to avoid early import
+    from werkzeug.serving import make_server
 
-    base_url = f"http://127.0.0.1:{port}"
+    from dashboard import server as flask_server  # import here to avoid early import
 
-    def _run():
-        dash_app.run_server(host="127.0.0.1", port=port, debug=False, use_reloader=False)
-
-    th = threading.Thread(target=_run, name="dash-test-server", daemon=True)
+    httpd = make_server("127.0.0.1", port, flask_server, threaded=True)
+    th = threading.Thread(target=httpd.serve_forever, name="dash-test-server", daemon=True)
     th.start()
-
-    # wait for /health to be ready
-    deadline = time.time() + 20
-    health = f"{base_url}/health"
-    last_err = None
-    while time.time() < deadline:
-        try:
-            r = requests.get(health, timeout=1)
-            if r.status_code == 200:
-                break
-        except Exception as e:  # noqa: BLE001
-            last_err = e
-        time.sleep(0.2)
-    else:
-        raise RuntimeError(f"Server failed to start on {base_url}: {last_err}")
-
     try:
-        yield base_url
+        yield f"http://127.0.0.1:{port}"
     finally:
-        # No clean shutdown hook for Dash dev server; thread will terminate at test process end.
-        pass
+        httpd.shutdown()
+        th.join(timeout=5)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.aggregations import day_slice, group_codes, group_count, group_sum, group_valid_count, sorted_group_codes, summarize
+
+
+def test_group_kernels_match_pandas_groupby():
+    df = pd.DataFrame({
+        "team": pd.Categorical(["Data", "Web", "Data", None, "Web"], categories=["Data", "Ops", "Web"]),
+        "value": [1.0, 2.0, 3.0, 4.0, np.nan],
+    })
+    codes, labels = group_codes(df["team"])
+    assert list(labels) == ["Data", "Ops", "Web"]
+    assert group_count(codes, len(labels)).tolist() == [2, 0, 2]
+    expected = df.groupby("team", observed=False)["value"].sum()
+    assert group_sum(codes, df["value"].to_numpy(), len(labels)).tolist() == expected.tolist()
+
+
+def test_group_valid_count_matches_pandas_mean_divisor():
+    codes = np.array([0, 0, 1, 1, 2])
+    values = np.array([10.0, np.nan, np.nan, np.nan, 3.0])
+    n = group_valid_count(codes, values, 3)
+    assert n.tolist() == [1, 0, 1]
+    # sum / non-NaN count reproduces pandas' NaN-skipping mean; an all-NaN group has no mean
+    expected = pd.Series(values).groupby(codes).mean()
+    assert (group_sum(codes, values, 3)[[0, 2]] / n[[0, 2]]).tolist() == expected[[0, 2]].tolist()
+    assert np.isnan(expected[1])
+
+
+def test_group_codes_factorizes_object_columns_sorted():
+    codes, labels = group_codes(pd.Series(["b", "a", "b", None]))
+    assert list(labels) == ["a", "b"]
+    assert group_count(codes, len(labels)).tolist() == [1, 2]
+
+
+def test_summarize_fuses_kpis_and_groupings():
+    df = pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-02", "2025-01-02", "2025-01-02"],
+        "product": ["A", "B", "A", "A"],
+        "system": pd.Categorical(["Core", "Web", "Web", "Core"]),
+        "status": pd.Categorical(["Red", "Red", "Red", "Green"]),
+        "team": ["Data", "Data", "Ops", "Ops"],
+        "revenue": [10.0, 20.0, 30.0, 40.0],
+        "cost": [1.0, 2.0, 3.0, 4.0],
+        "profit": [9.0, 18.0, 27.0, 36.0],
+    })
+    s = summarize(df, "product", "2025-01-02")
+    assert (s.total_revenue, s.total_cost, s.total_profit) == (100.0, 10.0, 90.0)
+    assert list(s.dim_labels) == ["A", "B"]
+    assert s.dim_revenue.tolist() == [80.0, 20.0]
+    assert s.date_profit.tolist() == [9.0, 81.0]
+    assert s.team_rows.tolist() == [2, 2]
+    # Only "Web" is Red on the requested day
+    assert s.red_systems == 1
+    red = s.system_status_rows[:, s.status_labels.get_loc("Red")]
+    assert red.tolist() == [1, 2]
+
+
+def test_day_slice_bounds_are_inclusive_and_open_ended():
+    dates = pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-02", "2025-01-04"]).to_numpy()
+    assert day_slice(dates, np.datetime64("2025-01-02"), np.datetime64("2025-01-02")) == slice(1, 3)
+    assert day_slice(dates, np.datetime64("2025-01-03")) == slice(3, 4)
+    assert day_slice(dates, end=np.datetime64("2025-01-01")) == slice(0, 1)
+    assert day_slice(dates, np.datetime64("2025-01-05"), np.datetime64("2025-01-01")) == slice(4, 4)
+
+
+def test_summarize_red_systems_matches_pandas_reference():
+    rng = np.random.default_rng(7)
+    n = 500
+    df = pd.DataFrame({
+        "date": pd.to_datetime("2025-01-01") + pd.to_timedelta(rng.integers(0, 5, n), unit="D"),
+        "system": pd.Categorical(rng.choice(["Core", "Web", "Mobile", None], n)),
+        "status": pd.Categorical(rng.choice(["Green", "Amber", "Red"], n)),
+        "team": "Data",
+        "revenue": 1.0,
+        "cost": 1.0,
+        "profit": 0.0,
+    }).sort_values("date", kind="stable", ignore_index=True)
+    today = pd.Timestamp("2025-01-03")
+    expected = df[(df["date"] == today) & (df["status"] == "Red")]["system"].nunique()
+    assert summarize(df, "team", today).red_systems == expected
+
+
+def test_sorted_group_codes_match_factorized_codes():
+    col = pd.Series(pd.to_datetime(["2025-01-01", "2025-01-01", "2025-01-03", "2025-01-04", None]))
+    codes, labels = sorted_group_codes(col)
+    ref_codes, ref_labels = group_codes(col)
+    assert codes.tolist() == ref_codes.tolist() == [0, 0, 1, 2, 3]
+    assert labels.equals(ref_labels)
@@ -18,6 +18,19 @@ def test_default_claims_used_when_disabled(monkeypatch):
     assert "exp" in claims
 
 
+def test_default_claims_reused_within_the_hour(monkeypatch):
+    svc = AuthService(settings=make_settings(disable_auth=True, jwt_secret="s"))
+    monkeypatch.setattr("dashboard.auth.time.time", lambda: 7200.0)
+    first = svc.default_claims()
+    first["role"] = "CIO"  # callers get their own copy
+    monkeypatch.setattr("dashboard.auth.time.time", lambda: 10799.0)
+    second = svc.default_claims()
+    assert second["role"] == "Developer"
+    assert second["exp"] == 4 * 3600
+    monkeypatch.setattr("dashboard.auth.time.time", lambda: 10800.0)
+    assert svc.default_claims()["exp"] == 5 * 3600
+
+
 def test_decode_and_role_mapping_valid_token():
     s = make_settings(jwt_secret="secret", disable_auth=False)
     svc = AuthService(settings=s)
@@ -33,3 +46,39 @@ def test_decode_invalid_token_raises():
     svc = AuthService(settings=s)
     with pytest.raises(Exception):
         svc._decode_jwt("not-a-token")
+
+
+def test_decode_rejects_expired_and_missing_exp():
+    s = make_settings(jwt_secret="secret")
+    svc = AuthService(settings=s)
+    expired = jwt.encode({"sub": "a", "exp": int(time.time()) - 10}, s.jwt_secret, algorithm="HS256")
+    no_exp = jwt.encode({"sub": "a"}, s.jwt_secret, algorithm="HS256")
+    with pytest.raises(jwt.ExpiredSignatureError):
+        svc._decode_jwt(expired)
+    with pytest.raises(jwt.MissingRequiredClaimError):
+        svc._decode_jwt(no_exp)
+
+
+def test_validate_token_memoizes_until_expiry(monkeypatch):
+    s = make_settings(jwt_secret="secret")
+    svc = AuthService(settings=s)
+    tok = jwt.encode({"sub": "a", "role": "Engineer", "exp": int(time.time()) + 60}, s.jwt_secret, algorithm="HS256")
+
+    calls = {"n": 0}
+    orig = svc._decode_jwt
+
+    def counting(token):
+        calls["n"] += 1
+        return orig(token)
+
+    monkeypatch.setattr(svc, "_decode_jwt", counting)
+    first = svc.validate_token(tok)
+    second = svc.validate_token(tok)
+    assert first == second
+    assert first["role"] == "Developer"
+    assert calls["n"] == 1
+
+    # A different secret must not reuse the cached result
+    svc.settings = make_settings(jwt_secret="other")
+    with pytest.raises(jwt.InvalidSignatureError):
+        svc.validate_token(tok)
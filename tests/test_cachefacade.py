@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from types import SimpleNamespace
 
 import pandas as pd
 from flask import Flask
@@ -40,3 +41,24 @@ def test_cachefacade_with_flask_cache_memoizes():
     assert wrapped(10) == 11
     # Second call should hit cache
     assert calls["n"] == 1
+
+
+def test_cachefacade_with_plain_store_memoizes():
+    store = {}
+    facade = CacheFacade(
+        cache=SimpleNamespace(get=store.get, set=lambda k, v, timeout=None: store.__setitem__(k, v)),
+        timeout_seconds=60,
+    )
+
+    calls = {"n": 0}
+
+    def fn(x, scale=1):
+        calls["n"] += 1
+        return x * scale
+
+    wrapped = facade.memoize(fn)
+    assert wrapped(4, scale=2) == 8
+    assert wrapped(4, scale=2) == 8
+    assert wrapped(4) == 4
+    assert calls["n"] == 2
+    assert len(store) == 2
@@ -1,25 +1,35 @@
-import datetime as dt
-
+import numpy as np
 import pandas as pd
+import pytest
 
-from dashboard.callbacks import Filters, _filter_df
+from dashboard.callbacks import (
+    _GROUPBY_COLUMNS, _filter_df, _isin_mask, _norm_list, _norm_number, _norm_query, _store_frame, _table_records,
+)
+from dashboard.datasources.ipc import frame_to_b64
 
 
 def make_df():
-    data = [
-        {"date": dt.date(2025, 1, 1), "product":"A","region":"EMEA","system":"Core","team":"Data","owner":"alice","status":"Green","revenue":100.0,"cost":60.0,"profit":40.0},
-        {"date": dt.date(2025, 1, 2), "product":"B","region":"APAC","system":"Web","team":"Platform","owner":"bob","status":"Red","revenue":50.0,"cost":80.0,"profit":-30.0},
-        {"date": dt.date(2025, 1, 3), "product":"A","region":"EMEA","system":"Core","team":"Data","owner":"carol","status":"Amber","revenue":70.0,"cost":20.0,"profit":50.0},
-    ]
-    return pd.DataFrame(data)
+    # Typed column arrays; repository contract: datetime64 dates, sorted ascending
+    return pd.DataFrame({
+        "date": np.array(["2025-01-01", "2025-01-02", "2025-01-03"], dtype="datetime64[ns]"),
+        "product": np.array(["A", "B", "A"], dtype=object),
+        "region": np.array(["EMEA", "APAC", "EMEA"], dtype=object),
+        "system": np.array(["Core", "Web", "Core"], dtype=object),
+        "team": np.array(["Data", "Platform", "Data"], dtype=object),
+        "owner": np.array(["alice", "bob", "carol"], dtype=object),
+        "status": np.array(["Green", "Red", "Amber"], dtype=object),
+        "revenue": np.array([100.0, 50.0, 70.0]),
+        "cost": np.array([60.0, 80.0, 20.0]),
+        "profit": np.array([40.0, -30.0, 50.0]),
+    }, copy=False)
 
 
-def test_filters_validation_lists_and_query():
-    f = Filters(products="A", regions=["EMEA"], systems=None, teams="Data", owner_query="  Alice  ")
-    assert f.products == ["A"]
-    assert f.regions == ["EMEA"]
-    assert f.teams == ["Data"]
-    assert f.owner_query == "Alice"
+def test_norm_helpers_lists_and_query():
+    assert _norm_list("A") == ["A"]
+    assert _norm_list(["EMEA"]) == ["EMEA"]
+    assert _norm_list(None) is None and _norm_list("") is None
+    assert _norm_query("  Alice  ") == "Alice"
+    assert _norm_query("   ") is None
 
 
 def test_filter_df_all_parameters():
@@ -55,3 +65,56 @@ def test_filter_df_min_profit_and_owner_case_insensitive():
     )
     assert len(out) == 1
     assert out.iloc[0]["owner"] == "carol"
+
+
+def test_filter_df_categorical_columns_match_object_columns():
+    df = make_df()
+    cat_df = df.astype({c: "category" for c in ("product", "region", "system", "team", "owner", "status")})
+    kwargs = dict(start_date=None, end_date=None, products=["A", "Z"], regions=None,
+                  systems=["Core", "Web"], teams=None, min_profit=None, owner_query="AR")
+    out = _filter_df(df, **kwargs)
+    cat_out = _filter_df(cat_df, **kwargs)
+    assert cat_out["owner"].astype(str).tolist() == out["owner"].tolist() == ["carol"]
+
+
+def test_store_frame_reuses_decoded_payload():
+    payload = frame_to_b64(make_df())
+    first = _store_frame(payload)
+    assert _store_frame("".join(payload)) is first
+    assert first["profit"].tolist() == [40.0, -30.0, 50.0]
+
+
+def test_filter_df_owner_query_skips_missing_owners():
+    df = make_df()
+    df.loc[1, "owner"] = None
+    cat_df = df.astype({"owner": "category"})
+    out = _filter_df(cat_df, None, None, None, None, None, None, None, "o")
+    assert out["owner"].astype(str).tolist() == ["carol"]
+
+
+def test_groupby_allowlist_and_bad_numbers():
+    assert _norm_number("12.5") == 12.5
+    assert _norm_number(None) is None
+    assert "team" in _GROUPBY_COLUMNS and "revenue" not in _GROUPBY_COLUMNS
+    with pytest.raises(ValueError):
+        _norm_number("lots")
+
+
+def test_filter_df_exits_early_on_empty_selection():
+    df = make_df()
+    out = _filter_df(df, None, None, ["Z"], ["EMEA"], None, None, None, "al")
+    assert out.empty
+    assert list(out.columns) == list(df.columns)
+
+
+def test_table_records_match_to_dict_with_iso_dates():
+    df = make_df().astype({"owner": "category"})
+    expected = df.assign(date=df["date"].dt.strftime("%Y-%m-%d")).astype({"owner": str}).to_dict(orient="records")
+    assert _table_records(df) == expected
+
+
+def test_isin_mask_lookup_table_path_matches_isin():
+    col = pd.Series(list("abcdefgh") * 3 + [None], dtype="category")
+    values = ["a", "c", "d", "f", "h", "zz"]
+    assert _isin_mask(col, values).tolist() == col.isin(values).tolist()
+    assert _isin_mask(col, ["b"]).tolist() == col.isin(["b"]).tolist()
@@ -16,13 +16,26 @@ def test_settings_aliases_env(monkeypatch):
     monkeypatch.setenv("PORT", "8123")
     monkeypatch.setenv("DEBUG", "1")
     monkeypatch.setenv("DATA_SOURCE", "synthetic")
+    monkeypatch.setenv("TABLE_MAX_ROWS", "250")
     s = Settings()
     assert s.port == 8123
     assert s.debug is True
     assert s.data_source == "SYNTHETIC"
+    assert s.table_max_rows == 250
 
 
 def test_direct_instantiation_defaults():
     s = Settings()
     assert isinstance(s.max_rows, int)
     assert s.cache_type in ("SimpleCache", "RedisCache")
+
+
+def test_port_and_debug_resolve_lazily(settings):
+    from dashboard import config
+
+    assert "PORT" not in vars(config)
+    assert config.get_settings() is settings
+    assert config.PORT == settings.port
+    assert config.DEBUG is settings.debug
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
@@ -1,4 +1,5 @@
 import json
+import os
 from types import SimpleNamespace
 
 import numpy as np
@@ -44,22 +45,102 @@ def test_rest_provider_fetch_and_normalize(monkeypatch):
     ]
 
     class FakeResp:
+        headers = {"Content-Type": "application/json"}
         def __init__(self, obj):
             self._obj = obj
+            self.content = json.dumps(obj).encode()
         def raise_for_status(self):
             return None
         def json(self):
             return self._obj
 
-    def fake_get(url, timeout):  # noqa: ARG001
+    def fake_get(session, url, timeout):  # noqa: ARG001
         assert url.endswith("/metrics")
         return FakeResp(payload)
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", fake_get)
 
     df = RestProvider(settings=s).load()
     assert set(["date","product","region","system","team","owner","status","revenue","cost","profit"]) <= set(df.columns)
     assert float(df.loc[0, "profit"]) == 40.0
+    assert isinstance(df["product"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_dtype(df["date"])
+
+
+def test_rest_provider_reads_ndjson_with_arrow(monkeypatch):
+    s = Settings(api_base_url="https://api.example.com")
+    rows = [
+        {"date": "2025-01-02", "product": "Beta", "region": "APAC", "system": "Web", "team": "Data",
+         "owner": "bob", "status": "Red", "revenue": 30.0, "cost": 45.0},
+        {"date": "2025-01-01", "product": "Alpha", "region": "EMEA", "system": "Core", "team": "Data",
+         "owner": "alice", "status": "Green", "revenue": 100.0, "cost": 60.0},
+    ]
+    resp = SimpleNamespace(
+        headers={"Content-Type": "application/x-ndjson"},
+        content="\n".join(json.dumps(r) for r in rows).encode(),
+        raise_for_status=lambda: None,
+    )
+    monkeypatch.setattr("requests.Session.get", lambda session, url, timeout: resp)
+
+    df = RestProvider(settings=s).load()
+    assert df["profit"].tolist() == [-15.0, 40.0]
+    assert df["owner"].cat.categories.tolist() == ["alice", "bob"]
+    assert df["owner"].cat.ordered
+    assert pd.api.types.is_datetime64_dtype(df["date"])
+
+
+def test_rest_provider_unions_keys_and_promotes_across_endpoints(monkeypatch):
+    s = Settings(api_base_url="https://api.example.com")
+    pages = {
+        # First record lacks `cost`/`owner`: later records must still keep them
+        "https://api.example.com/a": [
+            {"date": "2025-01-01", "product": "A", "region": "APAC", "system": "Core", "team": "Data",
+             "status": "Green", "revenue": 100},
+            {"date": "2025-01-02", "product": "B", "region": "EMEA", "system": "Web", "team": "Data",
+             "owner": "bob", "status": "Red", "revenue": 50, "cost": 20},
+        ],
+        # Column-oriented payload with float revenue
+        "https://api.example.com/b": {
+            "date": ["2025-01-03"], "product": ["C"], "region": ["AMER"], "system": ["Web"], "team": ["Ops"],
+            "owner": ["carol"], "status": ["Amber"], "revenue": [10.5], "cost": [0.5],
+        },
+    }
+
+    def fake_get(session, url, timeout):  # noqa: ARG001
+        return SimpleNamespace(
+            headers={"Content-Type": "application/json"},
+            content=json.dumps(pages[url]).encode(),
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+    monkeypatch.setattr(RestProvider, "_endpoints", lambda self: list(pages))
+
+    df = RestProvider(settings=s).load()
+    assert df["revenue"].tolist() == [100.0, 50.0, 10.5]
+    assert df["profit"].tolist()[1:] == [30.0, 10.0]
+    assert pd.isna(df.loc[0, "cost"])
+    assert df["owner"].tolist()[1:] == ["bob", "carol"]
+
+
+def test_rest_provider_accepts_mixed_type_json_columns(monkeypatch):
+    s = Settings(api_base_url="https://api.example.com")
+    rows = [
+        {"date": "2025-01-01", "product": "A", "region": "APAC", "system": "Core", "team": "Data",
+         "owner": 1, "status": "Green", "revenue": 10.0, "cost": 4.0},
+        {"date": "2025-01-02", "product": "B", "region": "EMEA", "system": "Web", "team": "Data",
+         "owner": "bob", "status": "Red", "revenue": 20.0, "cost": 5.0},
+    ]
+    resp = SimpleNamespace(
+        headers={"Content-Type": "application/json"},
+        content=json.dumps(rows).encode(),
+        raise_for_status=lambda: None,
+    )
+    monkeypatch.setattr("requests.Session.get", lambda session, url, timeout: resp)
+
+    df = RestProvider(settings=s).load()
+    assert df["owner"].tolist() == ["1", "bob"]
+    assert df["profit"].tolist() == [6.0, 15.0]
 
 
 def test_sql_provider_fetch_and_normalize(monkeypatch):
@@ -71,13 +152,89 @@ def test_sql_provider_fetch_and_normalize(monkeypatch):
         assert url == s.db_url
         return DummyEngine()
 
-    def fake_read_sql(sql, engine):  # noqa: ARG001
+    def fake_read_sql(sql, engine, params, parse_dates):  # noqa: ARG001
+        assert "LIMIT :max_rows" in str(sql)
+        assert params["max_rows"] == s.max_rows
+        assert parse_dates == ["date"]
         return pd.DataFrame([
-            {"date": "2025-01-02", "product":"A", "region":"APAC", "system":"Core", "team":"Data", "owner":"bob", "status":"Amber", "revenue": 200.0, "cost": 50.0}
+            {"date": "2025-01-02", "product":"A", "region":"APAC", "system":"Core", "team":"Data", "owner":"bob", "status":"Amber", "revenue": 200.0, "cost": 50.0, "profit": 150.0}
         ])
 
     monkeypatch.setattr("dashboard.datasources.sql.create_engine", fake_create_engine)
     monkeypatch.setattr(pd, "read_sql", fake_read_sql)
 
-    df = SqlProvider(settings=s).load()
+    provider = SqlProvider(settings=s)
+    df = provider.load()
     assert float(df.loc[0, "profit"]) == 150.0
+    assert provider._get_engine() is provider._get_engine()
+
+
+def test_sql_provider_disposes_pool_without_closing_after_fork():
+    calls = []
+
+    class DummyEngine:
+        def dispose(self, close=True):
+            calls.append(close)
+
+    provider = SqlProvider(settings=Settings(db_url="postgresql://u:p@h/db"))
+    provider._reset_after_fork()  # no engine yet: nothing to do
+    provider._engine = DummyEngine()
+    provider._reset_after_fork()
+    assert calls == [False]
+
+
+def test_after_fork_registry_does_not_grow_with_dead_providers():
+    from dashboard.datasources import base
+
+    for _ in range(50):
+        SqlProvider(settings=Settings(db_url="postgresql://u:p@h/db"))
+    keep = SqlProvider(settings=Settings(db_url="postgresql://u:p@h/db"))
+    assert len(base._after_fork) <= 2
+    assert any(ref() == keep._reset_after_fork for ref in base._after_fork)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_rest_provider_session_is_not_inherited_by_forked_children():
+    provider = RestProvider(settings=Settings(api_base_url="https://api.example.com"))
+    parent_session = provider._get_session()
+
+    pid = os.fork()
+    if pid == 0:  # child: the registered hook must have dropped the session
+        os._exit(0 if provider._session is None else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert provider._get_session() is parent_session
+
+
+def test_synthetic_provider_emits_categorical_columns():
+    df = SyntheticProvider(settings=Settings(max_rows=50), seed=3).load()
+    for col in ("product", "region", "system", "team", "owner", "status"):
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert df["revenue"].min() >= 1000
+    assert df["cost"].min() >= 500
+    assert np.allclose(df["profit"], df["revenue"] - df["cost"])
+    assert df["date"].is_monotonic_increasing
+
+
+def test_frame_to_csv_writes_iso_dates():
+    from dashboard.datasources.ipc import frame_to_csv
+
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+        "owner": pd.Categorical(["alice", "bob"]),
+        "profit": [1.5, -2.0],
+    })
+    lines = frame_to_csv(df).splitlines()
+    assert len(lines) == 3
+    assert lines[1].startswith("2025-01-01,")
+    assert "alice" in lines[1] and lines[2].endswith(",-2")
+
+
+def test_store_payload_roundtrips_compressed():
+    from dashboard.datasources.ipc import frame_from_b64, frame_to_b64, frame_to_ipc
+
+    df = SyntheticProvider(settings=Settings(max_rows=500), seed=5).load()
+    payload = frame_to_b64(df)
+    assert len(payload) * 3 / 4 < len(frame_to_ipc(df))
+    out = frame_from_b64(payload)
+    pd.testing.assert_frame_equal(out, df)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
+import pytest
 from flask import Flask
 from flask_caching import Cache
 
@@ -15,21 +17,24 @@ from dashboard.utils import today_key
 @dataclass
 class FakeProvider(DataProvider):
     rows: int
+    date: str = "2025-01-01"
 
     def load(self) -> pd.DataFrame:  # type: ignore[override]
-        df = pd.DataFrame({
-            "date": ["2025-01-01"] * self.rows,
-            "product": ["A"] * self.rows,
-            "region": ["APAC"] * self.rows,
-            "system": ["Core"] * self.rows,
-            "team": ["Data"] * self.rows,
-            "owner": ["alice"] * self.rows,
-            "status": ["Green"] * self.rows,
-            "revenue": [100.0] * self.rows,
-            "cost": [60.0] * self.rows,
-        })
-        df["profit"] = df["revenue"] - df["cost"]
-        return df
+        n = self.rows
+        revenue = np.full(n, 100.0)
+        cost = np.full(n, 60.0)
+        return pd.DataFrame({
+            "date": np.full(n, self.date, dtype=object),
+            "product": np.full(n, "A", dtype=object),
+            "region": np.full(n, "APAC", dtype=object),
+            "system": np.full(n, "Core", dtype=object),
+            "team": np.full(n, "Data", dtype=object),
+            "owner": np.full(n, "alice", dtype=object),
+            "status": np.full(n, "Green", dtype=object),
+            "revenue": revenue,
+            "cost": cost,
+            "profit": revenue - cost,
+        }, copy=False)
 
 
 def test_repository_capping_and_normalization():
@@ -40,6 +45,16 @@ def test_repository_capping_and_normalization():
     assert len(df) == 50
     # date coerced to date
     assert pd.api.types.is_object_dtype(df["date"]) or str(df["date"].dtype).startswith("datetime")
+    # label columns normalized to categoricals
+    assert isinstance(df["team"].dtype, pd.CategoricalDtype)
+    assert df["team"].cat.categories.tolist() == ["Data"]
+
+
+def test_repository_drops_timezone_from_iso_utc_dates():
+    repo = DataRepository(provider=FakeProvider(rows=3, date="2025-01-01T10:00:00Z"), settings=Settings(max_rows=10))
+    df = repo.load_uncached()
+    assert df["date"].dtype == "datetime64[ns]"
+    assert (df["date"] == pd.Timestamp("2025-01-01")).all()
 
 
 def test_repository_caching_with_flask_cache(monkeypatch):
@@ -68,3 +83,45 @@ def test_repository_caching_with_flask_cache(monkeypatch):
     # Force key should bypass same memoized value
     _ = repo.get_data(force_key=f"{key}__123")
     assert calls["count"] == 2
+
+
+def test_repository_cached_frame_roundtrips_through_arrow():
+    s = Settings(max_rows=40)
+    repo = DataRepository(settings=s)
+
+    server = Flask(__name__)
+    cache = Cache(server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60})
+    repo.set_cache(cache)
+
+    first = repo.get_data(force_key="arrow-roundtrip")
+    assert len(first) == 40
+    assert isinstance(first["status"].dtype, pd.CategoricalDtype)
+    # Decoded columns are read-only views over the cached bytes
+    with pytest.raises(ValueError):
+        first.loc[0, "revenue"] = -1.0
+    second = repo.get_data(force_key="arrow-roundtrip")
+    assert second["revenue"].equals(first["revenue"])
+
+
+def test_warm_cache_fills_todays_entry(monkeypatch, dash_app_and_server):
+    from dashboard import data
+
+    calls = {"count": 0}
+    orig = data._repo.load_uncached
+
+    def wrapped():
+        calls["count"] += 1
+        return orig()
+
+    monkeypatch.setattr(data._repo, "load_uncached", wrapped)
+    data._repo.cache_facade.cache.clear()
+    data.warm_cache()
+    data.get_data()
+    assert calls["count"] == 1
+
+
+def test_get_data_for_team_narrows_on_codes():
+    repo = DataRepository(provider=FakeProvider(rows=5), settings=Settings(max_rows=50))
+    assert len(repo.get_data_for_team("Data")) == 5
+    missing = repo.get_data_for_team("Retail")
+    assert missing.empty and list(missing.columns) == list(repo.get_data().columns)
@@ -1,5 +1,4 @@
-from dashboard.server import ServerFactory
-from dashboard import config
+from dashboard.server import ServerFactory, create_app, create_cache, create_server
 
 
 def test_health_endpoint(flask_client):
@@ -10,8 +9,7 @@ def test_health_endpoint(flask_client):
     assert "time" in js
 
 
-def test_server_factory_title_and_cache():
-    settings = config.get_settings()
+def test_server_factory_title_and_cache(settings):
     factory = ServerFactory(settings)
     server = factory.create_server()
     cache = factory.create_cache(server)
@@ -20,3 +18,31 @@ def test_server_factory_title_and_cache():
     assert app.title == settings.app_title
     # Cache configured type matches settings
     assert cache.config.get("CACHE_TYPE") == settings.cache_type
+
+
+def test_orjson_provider_roundtrip(flask_client):
+    server = flask_client.application
+    assert server.json.dumps({"b": 1, "a": [1.5, None]}) == '{"a":[1.5,null],"b":1}'
+    assert server.json.loads(b'{"x": [1, 2]}') == {"x": [1, 2]}
+
+
+def test_module_wrappers_reuse_process_instances():
+    import dashboard
+
+    assert create_server() is dashboard.server
+    assert create_cache(dashboard.server) is dashboard.cache
+    assert create_app(dashboard.server) is dashboard.app
+
+
+def test_gunicorn_cpu_quota_parsing(tmp_path):
+    import runpy
+    from pathlib import Path
+
+    conf = runpy.run_path(str(Path(__file__).parent.parent / "gunicorn.conf.py"))
+    quota = conf["_cgroup_cpu_quota"]
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("150000 100000\n")
+    assert quota(str(cpu_max)) == 2
+    cpu_max.write_text("max 100000\n")
+    assert quota(str(cpu_max)) is None
+    assert quota(str(tmp_path / "missing")) is None
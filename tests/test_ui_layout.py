@@ -13,3 +13,47 @@ def test_serve_layout_returns_component():
     assert "region-dd" in s
     assert "refresh-btn" in s
     assert "export-btn" in s
+
+
+def test_controls_are_built_once_per_day_and_labels():
+    from dashboard.ui import _controls
+
+    labels = (("A", "B"), ("APAC",), ("Core",), ("Data",))
+    first = _controls("2025-01-01", *labels)
+    assert _controls("2025-01-01", *labels) is first
+    assert "product-dd" in str(first)
+    assert first.children[1].value == ["A", "B"]
+    # New labels after a data refresh rebuild the controls the same day
+    refreshed = _controls("2025-01-01", ("A", "B", "C"), *labels[1:])
+    assert refreshed is not first
+    assert [o["value"] for o in refreshed.children[1].options] == ["A", "B", "C"]
+    assert first.children[0].end_date.isoformat() == "2025-01-01"
+    assert first.children[0].start_date.isoformat() == "2024-12-02"
+    assert all(set(o) == {"label", "value"} for o in first.children[1].options)
+
+
+def test_tabs_are_built_once_per_role():
+    from dashboard.ui import _role_bits, _tabs
+
+    cio = _tabs(_role_bits("CIO"))
+    assert _tabs(_role_bits("CIO")) is cio
+    assert cio.value == "cio"
+    dev = _tabs(_role_bits("Developer"))
+    assert dev.value == "dev"
+    assert [t.disabled for t in dev.children] == [True, True, False]
+    # Unknown roles fall back to the Developer view and share its tree
+    assert _tabs(_role_bits("Intern")) is dev
+
+
+def test_claims_store_drops_exp_and_is_reused():
+    from flask import Flask
+
+    from dashboard.auth import current_claims
+    from dashboard.ui import UIBuilder
+
+    with Flask(__name__).test_request_context("/"):
+        first = UIBuilder(title="t").build_layout().children[0]
+        second = UIBuilder(title="t").build_layout().children[0]
+        assert "exp" in current_claims()
+    assert first is second
+    assert first.id == "claims-store" and "exp" not in first.data
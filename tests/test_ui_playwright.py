@@ -3,6 +3,7 @@ import pytest
 
 @pytest.mark.e2e
 @pytest.mark.slow
+@pytest.mark.xdist_group("live_server")  # one live server on the fixed test port
 def test_ui_loads_kpis_and_exports_csv(live_server_url):
     pw = pytest.importorskip("playwright.sync_api")
     from playwright.sync_api import sync_playwright
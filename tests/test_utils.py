@@ -1,5 +1,6 @@
 import datetime as dt
 
+from dashboard import utils
 from dashboard.utils import today_key, fmt_money
 
 
@@ -10,6 +11,18 @@ def test_today_key(monkeypatch):
             return cls(2025, 1, 15)
 
     monkeypatch.setattr(dt, "date", FakeDate)
+    monkeypatch.setattr(utils, "_today_cache", (0.0, 0.0, ""))  # drop any key cached for the real day
+    noon = dt.datetime(2025, 1, 15, 12).timestamp()
+    monkeypatch.setattr(utils.time, "time", lambda: noon)
+    assert today_key() == "2025-01-15"
+    # Reused until the next local midnight without consulting the date again
+    monkeypatch.setattr(FakeDate, "today", classmethod(lambda cls: cls(2025, 1, 16)))
+    assert today_key() == "2025-01-15"
+    monkeypatch.setattr(utils.time, "time", lambda: noon + 86400)
+    assert today_key() == "2025-01-16"
+    # A clock stepped back across midnight goes back to the earlier day
+    monkeypatch.setattr(FakeDate, "today", classmethod(lambda cls: cls(2025, 1, 15)))
+    monkeypatch.setattr(utils.time, "time", lambda: noon)
     assert today_key() == "2025-01-15"
 
 
@@ -19,5 +32,12 @@ def test_fmt_money_ranges():
     assert fmt_money(12_300) == "12K"
     assert fmt_money(12_900) == "13K"
     assert fmt_money(7_000_000) == "7M"
-    assert fmt_money(1_500_000_000) == "1B"
+    assert fmt_money(1_500_000_000) == "2B"  # rounds to the nearest whole unit, like 12_900 -> 13K
+    assert fmt_money(1_400_000_000) == "1B"
     assert fmt_money(2_000_000_000_000) == "2T"
+
+
+def test_fmt_money_sub_unit_negative_and_overflow():
+    assert fmt_money(0.4) == "0"
+    assert fmt_money(-12_300) == "-12K"
+    assert fmt_money(5e15) == "5,000T"